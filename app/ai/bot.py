@@ -1,6 +1,7 @@
 """BotPlayer — wires HandStrengthEstimator + StrategyEngine together."""
 from __future__ import annotations
-from typing import Tuple
+import random
+from typing import Optional, Tuple
 
 from app.ai.hand_strength import HandStrengthEstimator
 from app.ai.strategy import StrategyEngine
@@ -16,10 +17,10 @@ class BotPlayer:
     game state, player state, valid actions, and difficulty.
     """
 
-    def __init__(self, player_id: str) -> None:
+    def __init__(self, player_id: str, rng: Optional[random.Random] = None) -> None:
         self.player_id = player_id
-        self._estimator = HandStrengthEstimator()
-        self._strategy = StrategyEngine()
+        self._estimator = HandStrengthEstimator(rng=rng)
+        self._strategy = StrategyEngine(rng=rng)
 
     def decide(
         self,
@@ -9,26 +9,16 @@ from __future__ import annotations
 import random
 from typing import List, Optional
 
-from app.core.card import Card, Deck, Rank, Suit
-from app.core.hand_evaluator import eval_best
+from app.core.card import FULL_DECK, Card
+from app.core.hand_evaluator import eval_best_ints
 
 
 # ---------------------------------------------------------------------------
 # Chen formula for preflop hand strength (fast, approximate)
 # ---------------------------------------------------------------------------
 
-def chen_score(hole_cards: List[Card]) -> float:
-    """
-    Chen formula: approximate preflop hand strength as a score 0-20.
-    Higher = stronger hand.
-    """
-    if len(hole_cards) != 2:
-        return 0.0
-
-    c1, c2 = sorted(hole_cards, key=lambda c: c.rank._value_, reverse=True)
-    r1 = c1.rank._value_
-    r2 = c2.rank._value_
-    suited = c1.suit == c2.suit
+def _chen_formula(r1: int, r2: int, suited: bool) -> float:
+    """Chen score for high rank r1, low rank r2 (2–14)."""
     gap = r1 - r2
 
     # Base score from high card
@@ -55,9 +45,43 @@ def chen_score(hole_cards: List[Card]) -> float:
     return max(score, 0)
 
 
+# (high rank, low rank, suited) -> Chen score, for all 169 distinct starting
+# hands (pairs are never suited)
+_CHEN_SCORES: dict[tuple[int, int, bool], float] = {
+    (r1, r2, suited): _chen_formula(r1, r2, suited)
+    for r1 in range(2, 15)
+    for r2 in range(2, r1 + 1)
+    for suited in ((False,) if r1 == r2 else (True, False))
+}
+# Same keys -> Chen score normalized to [0, 1]
+_PREFLOP_EQUITY: dict[tuple[int, int, bool], float] = {
+    key: min(score / 20.0, 1.0) for key, score in _CHEN_SCORES.items()
+}
+
+
+def _preflop_key(hole_cards: List[Card]) -> tuple[int, int, bool]:
+    c1, c2 = hole_cards
+    r1, r2 = c1.rank._value_, c2.rank._value_
+    if r1 < r2:
+        r1, r2 = r2, r1
+    return r1, r2, c1.suit == c2.suit
+
+
+def chen_score(hole_cards: List[Card]) -> float:
+    """
+    Chen formula: approximate preflop hand strength as a score 0-20.
+    Higher = stronger hand.
+    """
+    if len(hole_cards) != 2:
+        return 0.0
+    return _CHEN_SCORES[_preflop_key(hole_cards)]
+
+
 def preflop_equity_fast(hole_cards: List[Card]) -> float:
     """Chen score normalized to [0, 1] range."""
-    return min(chen_score(hole_cards) / 20.0, 1.0)
+    if len(hole_cards) != 2:
+        return 0.0
+    return _PREFLOP_EQUITY[_preflop_key(hole_cards)]
 
 
 # ---------------------------------------------------------------------------
@@ -66,7 +90,7 @@ def preflop_equity_fast(hole_cards: List[Card]) -> float:
 
 def _all_cards() -> List[Card]:
     """Return all 52 cards."""
-    return [Card(rank, suit) for suit in Suit for rank in Rank]
+    return list(FULL_DECK)
 
 
 def monte_carlo_equity(
@@ -74,38 +98,47 @@ def monte_carlo_equity(
     community_cards: List[Card],
     num_opponents: int,
     simulations: int = 500,
+    seed: Optional[int] = None,
+    rng: Optional[random.Random] = None,
 ) -> float:
     """
     Estimate win equity for our hand vs `num_opponents` random hands.
 
     Returns a float [0, 1] representing win probability (ties count as 0.5).
+    Draws from `rng` (PokerGame passes its per-game generator) or the
+    module-level random generator, unless `seed` is given, in which case a
+    private generator is used.
     """
-    known_cards = set(str(c) for c in hole_cards + community_cards)
-    deck = [c for c in _all_cards() if str(c) not in known_cards]
+    # Work on Cactus Kev integers throughout: each card is encoded once here
+    # rather than on every 5-card combination of every trial.
+    hole = [c.to_int() for c in hole_cards]
+    community = [c.to_int() for c in community_cards]
+    known = set(hole + community)
+    deck = [i for i in map(Card.to_int, _all_cards()) if i not in known]
 
     wins = 0.0
-    board_needed = 5 - len(community_cards)
+    board_needed = 5 - len(community)
+    if seed is not None:
+        shuffle = random.Random(seed).shuffle
+    else:
+        shuffle = rng.shuffle if rng is not None else random.shuffle
 
     for _ in range(simulations):
-        random.shuffle(deck)
-        ptr = 0
+        shuffle(deck)
 
-        # Deal community cards
-        board = list(community_cards)
-        board.extend(deck[ptr:ptr + board_needed])
-        ptr += board_needed
-
-        # Deal opponent hole cards
-        opp_hands: List[List[Card]] = []
-        for _ in range(num_opponents):
-            opp_hands.append([deck[ptr], deck[ptr + 1]])
-            ptr += 2
+        # Deal community cards, then two hole cards per opponent
+        board = community + deck[:board_needed]
+        ptr = board_needed
 
         # Evaluate
-        our_score = eval_best(hole_cards + board)
-        our_best = our_score
+        our_best = eval_best_ints(hole + board)
 
-        best_opp = min(eval_best(hand + board) for hand in opp_hands)
+        best_opp = 9999
+        for _ in range(num_opponents):
+            score = eval_best_ints(deck[ptr:ptr + 2] + board)
+            if score < best_opp:
+                best_opp = score
+            ptr += 2
 
         if our_best < best_opp:
             wins += 1.0
@@ -122,15 +155,22 @@ class HandStrengthEstimator:
     difficulty: "easy" | "medium" | "hard"
     """
 
+    def __init__(self, rng: Optional[random.Random] = None) -> None:
+        # Monte Carlo draws come from rng (or the module-level generator).
+        self._rng = rng
+
     def estimate(
         self,
         hole_cards: List[Card],
         community_cards: List[Card],
         num_opponents: int,
         difficulty: str = "medium",
+        seed: Optional[int] = None,
     ) -> float:
         """
         Return equity estimate [0, 1].
+
+        seed: forwarded to monte_carlo_equity for a reproducible estimate.
         """
         if not hole_cards:
             return 0.5
@@ -147,7 +187,7 @@ class HandStrengthEstimator:
             else:
                 # Easy: rough Chen
                 return preflop_equity_fast(hole_cards) * 0.9
-            return monte_carlo_equity(hole_cards, [], num_opponents, sims)
+            return monte_carlo_equity(hole_cards, [], num_opponents, sims, seed, self._rng)
         else:
             # Postflop
             if difficulty == "hard":
@@ -156,4 +196,6 @@ class HandStrengthEstimator:
                 sims = 300
             else:
                 sims = 100
-            return monte_carlo_equity(hole_cards, community_cards, num_opponents, sims)
+            return monte_carlo_equity(
+                hole_cards, community_cards, num_opponents, sims, seed, self._rng,
+            )
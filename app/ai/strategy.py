@@ -7,7 +7,7 @@ Hard:    adds position awareness, bluffing (~15% frequency)
 """
 from __future__ import annotations
 import random
-from typing import Tuple
+from typing import Optional, Tuple
 
 from app.game.betting import BettingAction, ValidActions
 from app.game.game_state import GameState, PlayerState
@@ -16,6 +16,10 @@ from app.game.game_state import GameState, PlayerState
 class StrategyEngine:
     """Decides the bot action given equity and game context."""
 
+    def __init__(self, rng: Optional[random.Random] = None) -> None:
+        # Draw from the caller's generator, else the module-level one.
+        self._random = rng.random if rng is not None else random.random
+
     def decide(
         self,
         state: GameState,
@@ -46,16 +50,16 @@ class StrategyEngine:
         equity: float,
     ) -> Tuple[BettingAction, int]:
         if valid.can_check:
-            if equity > 0.7 and valid.can_raise and random.random() < 0.3:
+            if equity > 0.7 and valid.can_raise and self._random() < 0.3:
                 amount = self._pot_size_bet(state, 0.5, valid)
                 return BettingAction.RAISE, amount
             return BettingAction.CHECK, 0
 
         # Need to call
         pot_odds = self._pot_odds(state, valid)
-        if equity < 0.35 or (equity < pot_odds and random.random() < 0.8):
+        if equity < 0.35 or (equity < pot_odds and self._random() < 0.8):
             return BettingAction.FOLD, 0
-        if equity > 0.7 and valid.can_raise and random.random() < 0.2:
+        if equity > 0.7 and valid.can_raise and self._random() < 0.2:
             amount = self._pot_size_bet(state, 0.5, valid)
             return BettingAction.RAISE, amount
         return BettingAction.CALL, valid.call_amount
@@ -77,7 +81,7 @@ class StrategyEngine:
             if equity > 0.65 and valid.can_raise:
                 amount = self._pot_size_bet(state, 0.75, valid)
                 return BettingAction.RAISE, amount
-            if equity > 0.5 and valid.can_raise and random.random() < 0.3:
+            if equity > 0.5 and valid.can_raise and self._random() < 0.3:
                 amount = self._pot_size_bet(state, 0.5, valid)
                 return BettingAction.RAISE, amount
             return BettingAction.CHECK, 0
@@ -88,7 +92,7 @@ class StrategyEngine:
         if equity > 0.7 and valid.can_raise:
             amount = self._pot_size_bet(state, 1.0, valid)
             return BettingAction.RAISE, amount
-        if equity > 0.55 and valid.can_raise and random.random() < 0.4:
+        if equity > 0.55 and valid.can_raise and self._random() < 0.4:
             amount = self._pot_size_bet(state, 0.75, valid)
             return BettingAction.RAISE, amount
         return BettingAction.CALL, valid.call_amount
@@ -110,7 +114,7 @@ class StrategyEngine:
         in_position = self._is_in_position(state, player)
 
         # Bluff with 15% frequency in position when board is scary
-        bluffing = in_position and random.random() < 0.15
+        bluffing = in_position and self._random() < 0.15
 
         if valid.can_check:
             if equity > 0.6 and valid.can_raise:
@@ -135,7 +139,7 @@ class StrategyEngine:
             amount = self._pot_size_bet(state, size, valid)
             return BettingAction.RAISE, amount
 
-        if equity > 0.55 and valid.can_raise and in_position and random.random() < 0.5:
+        if equity > 0.55 and valid.can_raise and in_position and self._random() < 0.5:
             amount = self._pot_size_bet(state, 0.6, valid)
             return BettingAction.RAISE, amount
 
@@ -123,6 +123,11 @@ async def join_game(game_id: str, req: JoinGameRequest) -> Dict[str, Any]:
     }
 
 
+@router.get("/healthz")
+async def healthz() -> Dict[str, str]:
+    return {"status": "ok"}
+
+
 @router.get("/api/games")
 async def list_games() -> Dict[str, Any]:
     return {"games": game_manager.list_games()}
@@ -3,6 +3,7 @@ from __future__ import annotations
 import random
 from dataclasses import dataclass
 from enum import Enum
+from typing import Optional
 
 
 # Primes assigned to each rank (used by Cactus Kev evaluator)
@@ -88,17 +89,23 @@ class Card:
         return f"Card({self})"
 
 
+# Card is frozen, so the 52 instances are built once and shared by every deck.
+FULL_DECK: tuple[Card, ...] = tuple(Card(rank, suit) for suit in Suit for rank in Rank)
+
+
 class Deck:
-    def __init__(self) -> None:
+    def __init__(self, rng: Optional[random.Random] = None) -> None:
+        # Shuffle with the caller's generator, else the module-level one.
+        self._shuffle = rng.shuffle if rng is not None else random.shuffle
         self._cards: list[Card] = []
         self.reset()
 
     def reset(self) -> None:
-        self._cards = [Card(rank, suit) for suit in Suit for rank in Rank]
-        random.shuffle(self._cards)
+        self._cards = list(FULL_DECK)
+        self._shuffle(self._cards)
 
     def shuffle(self) -> None:
-        random.shuffle(self._cards)
+        self._shuffle(self._cards)
 
     def deal(self, n: int = 1) -> list[Card]:
         if n > len(self._cards):
@@ -17,7 +17,7 @@ Score ranges:
 from __future__ import annotations
 from enum import Enum
 from itertools import combinations
-from typing import List
+from typing import List, Sequence
 
 from app.core.card import Card
 
@@ -208,30 +208,43 @@ def eval_5(cards: List[Card]) -> int:
 def eval_7(cards: List[Card]) -> int:
     """Evaluate best 5-card hand from 7 cards. Returns score 1–7462 (lower=better)."""
     assert len(cards) == 7, f"eval_7 requires exactly 7 cards, got {len(cards)}"
-    best = 9999
-    for combo in combinations(cards, 5):
-        score = eval_5(list(combo))
-        if score < best:
-            best = score
-    return best
+    return eval_best_ints([c.to_int() for c in cards])
 
 
 def eval_best(cards: List[Card]) -> int:
     """Evaluate best 5-card hand from 5–7 cards."""
     n = len(cards)
-    if n == 5:
-        return eval_5(cards)
-    elif n == 6:
-        best = 9999
-        for combo in combinations(cards, 5):
-            score = eval_5(list(combo))
-            if score < best:
-                best = score
-        return best
-    elif n == 7:
-        return eval_7(cards)
-    else:
+    if not 5 <= n <= 7:
         raise ValueError(f"eval_best requires 5–7 cards, got {n}")
+    return eval_best_ints([c.to_int() for c in cards])
+
+
+def eval_best_ints(ints: Sequence[int]) -> int:
+    """
+    Evaluate best 5-card hand from 5–7 Cactus Kev integers (see Card.to_int).
+
+    For callers that evaluate the same cards many times (Monte Carlo trials):
+    encode once, then skip the per-combination Card conversion.
+    """
+    if len(ints) == 5:
+        return _eval_5_ints(*ints)
+    suits = [c & 0xF000 for c in ints]
+    if max(map(suits.count, set(suits))) >= 5:
+        return min(_eval_5_ints(*combo) for combo in combinations(ints, 5))
+
+    # No five cards share a suit, so every combination is a non-flush hand and
+    # only needs its prime product looked up.
+    unique5 = _UNIQUE5_TABLE.get
+    pairs = _PAIRS_TABLE
+    best = 9999
+    for p1, p2, p3, p4, p5 in combinations([c & 0x3F for c in ints], 5):
+        product = p1 * p2 * p3 * p4 * p5
+        score = unique5(product)
+        if score is None:
+            score = pairs[product]
+        if score < best:
+            best = score
+    return best
 
 
 def rank_to_class(score: int) -> HandClass:
@@ -1,16 +1,16 @@
 """Pot and side pot management."""
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Dict, FrozenSet, List, Optional
 
 
 @dataclass
 class SidePot:
     amount: int
-    eligible_player_ids: List[str]
+    eligible_player_ids: FrozenSet[str]
 
     def __repr__(self) -> str:
-        return f"SidePot(amount={self.amount}, eligible={self.eligible_player_ids})"
+        return f"SidePot(amount={self.amount}, eligible={sorted(self.eligible_player_ids)})"
 
 
 class PotManager:
@@ -64,8 +64,8 @@ class PotManager:
         if not self._contributions:
             return []
 
-        if active_player_ids is None:
-            active_player_ids = list(self._contributions.keys())
+        # Membership is tested once per contributor per pot level
+        active = set(self._contributions if active_player_ids is None else active_player_ids)
 
         # Only consider players who contributed something
         contributors = {pid: amt for pid, amt in self._contributions.items() if amt > 0}
@@ -77,9 +77,7 @@ class PotManager:
 
         side_pots: List[SidePot] = []
         already_taken: Dict[str, int] = {pid: 0 for pid in contributors}
-        remaining_caps = all_in_caps.copy()
-
-        for cap in remaining_caps:
+        for cap in all_in_caps:
             pot_amount = 0
             eligible: List[str] = []
             for pid, total_contrib in contributors.items():
@@ -88,10 +86,10 @@ class PotManager:
                     pot_amount += contribution_to_this_pot
                     already_taken[pid] += contribution_to_this_pot
                     # Eligible if active and contributed to this level
-                    if pid in active_player_ids:
+                    if pid in active:
                         eligible.append(pid)
             if pot_amount > 0:
-                side_pots.append(SidePot(amount=pot_amount, eligible_player_ids=eligible))
+                side_pots.append(SidePot(amount=pot_amount, eligible_player_ids=frozenset(eligible)))
 
         # Main pot: everything above all caps
         main_pot_amount = 0
@@ -100,11 +98,11 @@ class PotManager:
             leftover = total_contrib - already_taken[pid]
             if leftover > 0:
                 main_pot_amount += leftover
-                if pid in active_player_ids:
+                if pid in active:
                     main_eligible.append(pid)
 
         if main_pot_amount > 0:
-            side_pots.append(SidePot(amount=main_pot_amount, eligible_player_ids=main_eligible))
+            side_pots.append(SidePot(amount=main_pot_amount, eligible_player_ids=frozenset(main_eligible)))
 
         return side_pots
 
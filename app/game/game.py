@@ -7,6 +7,7 @@ State machine:
 from __future__ import annotations
 import asyncio
 import logging
+import os
 import random
 import uuid
 from typing import Any, Callable, Dict, List, Optional
@@ -28,6 +29,11 @@ from app.game.rules import (
 
 logger = logging.getLogger(__name__)
 
+# Test-only: POKER_FAST_BOTS=1 drops bot think-time and the pauses between
+# streets so automated runs don't wait on real-time pacing.  The pauses
+# around hand boundaries stay, so humans can still join before a deal.
+FAST_BOTS = os.environ.get("POKER_FAST_BOTS", "") == "1"
+
 
 class PokerGame:
     """
@@ -47,6 +53,7 @@ class PokerGame:
         max_players: int = 9,
         min_buy_in: Optional[int] = None,
         max_buy_in: Optional[int] = None,
+        rng_seed: Optional[int] = None,
     ) -> None:
         self.state = GameState(
             game_id=game_id,
@@ -59,12 +66,20 @@ class PokerGame:
         )
         self._players: Dict[str, Player] = {}
         self._pot_manager = PotManager()
-        self._deck = Deck()
+        # Deck shuffles, bot decisions and bot delays all draw from this
+        # per-game generator, so a seeded game replays without touching the
+        # process-wide random state other games share.
+        self.rng_seed = rng_seed
+        self._rng = random.Random(rng_seed)
+        self._deck = Deck(rng=self._rng)
         self._broadcast_cb: Optional[Callable] = None
         self._current_betting: Optional[BettingRound] = None
         self._hand_task: Optional[asyncio.Task] = None
+        self._bot_tasks: set[asyncio.Task] = set()
         self._action_event = asyncio.Event()
         self._pending_action: Optional[tuple[str, BettingAction, int]] = None
+        self._acting_player_id: Optional[str] = None
+        self.fast_bots = FAST_BOTS
 
     # ------------------------------------------------------------------
     # Player management
@@ -109,7 +124,13 @@ class PokerGame:
     # ------------------------------------------------------------------
 
     async def submit_action(self, player_id: str, action: BettingAction, amount: int = 0) -> None:
-        """Called externally (WebSocket handler) to submit a player action."""
+        """Called externally (WebSocket handler) to submit a player action.
+
+        Submissions from anyone but the player currently prompted are dropped.
+        """
+        if self._acting_player_id is not None and player_id != self._acting_player_id:
+            logger.warning(f"Ignoring out-of-turn action from {player_id}")
+            return
         self._pending_action = (player_id, action, amount)
         self._action_event.set()
 
@@ -123,6 +144,16 @@ class PokerGame:
         await self._broadcast("game_state", self._state_payload_factory)
         self._hand_task = asyncio.create_task(self._game_loop())
 
+    async def stop(self) -> None:
+        """Cancel the game loop and any pending bot actions, and wait for them."""
+        tasks = list(self._bot_tasks)
+        if self._hand_task is not None:
+            tasks.append(self._hand_task)
+        self._hand_task = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
     async def _game_loop(self) -> None:
         """Main game loop — runs hands until the game ends."""
         while True:
@@ -201,7 +232,7 @@ class PokerGame:
             return
 
         # FLOP — brief pause so clients can see the last action
-        await asyncio.sleep(1.5)
+        await self._pause(1.5)
         self.state.phase = GamePhase.FLOP
         for card in self._deck.deal(3):
             self.state.community_cards.append(card)
@@ -215,7 +246,7 @@ class PokerGame:
             return
 
         # TURN
-        await asyncio.sleep(1.5)
+        await self._pause(1.5)
         self.state.phase = GamePhase.TURN
         self.state.community_cards.append(self._deck.deal_one())
         self._reset_street_bets()
@@ -228,7 +259,7 @@ class PokerGame:
             return
 
         # RIVER
-        await asyncio.sleep(1.5)
+        await self._pause(1.5)
         self.state.phase = GamePhase.RIVER
         self.state.community_cards.append(self._deck.deal_one())
         self._reset_street_bets()
@@ -241,10 +272,14 @@ class PokerGame:
             return
 
         # Showdown
-        await asyncio.sleep(1.5)
+        await self._pause(1.5)
         self.state.phase = GamePhase.SHOWDOWN
         await self._run_showdown()
 
+    async def _pause(self, seconds: float) -> None:
+        """Cosmetic pause so clients can follow the action (skipped in fast-bots mode)."""
+        await asyncio.sleep(0 if self.fast_bots else seconds)
+
     def _reset_street_bets(self) -> None:
         for p in self.state.players:
             p.bet = 0
@@ -309,23 +344,27 @@ class PokerGame:
         player = self._players.get(expected_player_id)
         if player and player.is_bot:
             # Schedule bot action
-            asyncio.create_task(self._schedule_bot_action(expected_player_id))
+            task = asyncio.create_task(self._schedule_bot_action(expected_player_id))
+            self._bot_tasks.add(task)
+            task.add_done_callback(self._bot_tasks.discard)
 
-        # Wait for action event
+        # Wait for action event.  Check before clearing: a fast client can
+        # answer the your_turn prompt before we get here.
         while True:
-            self._action_event.clear()
-            await self._action_event.wait()
             if self._pending_action and self._pending_action[0] == expected_player_id:
                 action = self._pending_action
                 self._pending_action = None
+                self._acting_player_id = None
                 return action
+            self._action_event.clear()
+            await self._action_event.wait()
 
     async def _schedule_bot_action(self, player_id: str) -> None:
         """Schedule a bot action after a short delay."""
-        await asyncio.sleep(random.uniform(0.5, 2.0))
+        await self._pause(self._rng.uniform(0.5, 2.0))
         try:
             from app.ai.bot import BotPlayer
-            bot = BotPlayer(player_id)
+            bot = BotPlayer(player_id, rng=self._rng)
             ps = self.state.get_player(player_id)
             player_obj = self._players.get(player_id)
             difficulty = "medium"
@@ -341,8 +380,14 @@ class PokerGame:
             await self.submit_action(player_id, BettingAction.FOLD)
 
     async def _prompt_player(self, player_id: str, betting: BettingRound) -> None:
-        """Send a 'your_turn' event with valid actions."""
+        """Send a 'your_turn' event with valid actions.
+
+        Any action left over from an earlier turn is discarded first, so only
+        an answer to this prompt can be applied.
+        """
         valid = betting.get_valid_actions(player_id)
+        self._pending_action = None
+        self._acting_player_id = player_id
 
         def factory(pid: str, _vid=player_id, _v=valid) -> Optional[dict]:
             if pid != _vid:
@@ -383,7 +428,7 @@ class PokerGame:
             from app.core.pot import SidePot
             side_pots = [SidePot(
                 amount=self.state.pot,
-                eligible_player_ids=active_ids,
+                eligible_player_ids=frozenset(active_ids),
             )]
 
         winners_info: List[dict] = []
@@ -476,7 +476,7 @@ class CLIGame:
 
         if not side_pots:
             from app.core.pot import SidePot
-            side_pots = [SidePot(amount=state.pot, eligible_player_ids=active_ids)]
+            side_pots = [SidePot(amount=state.pot, eligible_player_ids=frozenset(active_ids))]
 
         winners_info = []
         for pot in side_pots:
@@ -1,13 +1,44 @@
 """Shared fixtures for all tests."""
 import asyncio
-import socket
+import os
+import queue
+import re
 import subprocess
 import sys
-import time
+import threading
+import warnings
+from types import SimpleNamespace
 
+import httpx
 import pytest
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        "--runslow", action="store_true", default=False,
+        help="also run tests marked @pytest.mark.slow",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "slow: long-running simulation; skipped unless --runslow is given",
+    )
+    # Registered here too so the marker is known when pytest-xdist isn't installed
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run on one xdist worker under --dist loadgroup",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="slow; pass --runslow to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
 @pytest.fixture(autouse=True)
 def _ensure_event_loop(request):
     """Ensure a fresh event loop exists for every *sync* test.
@@ -19,7 +50,9 @@ def _ensure_event_loop(request):
     cleans it up afterward.
 
     Async tests are skipped — pytest-asyncio manages their own event loops
-    and this fixture must not interfere with that.
+    and this fixture must not interfere with that.  The loop that was current
+    before is put back afterwards: pytest-asyncio releases before 1.2 run
+    async tests on the current loop, which must stay the shared session loop.
     """
     import inspect
     if inspect.iscoroutinefunction(request.node.obj):
@@ -27,46 +60,88 @@ def _ensure_event_loop(request):
         yield
         return
 
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        try:
+            previous = asyncio.get_event_loop_policy().get_event_loop()
+        except RuntimeError:
+            previous = None
     loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
     yield
     loop.close()
+    asyncio.set_event_loop(previous)
 
 
 # ---------------------------------------------------------------------------
 # Shared live-server fixture (used by both e2e and ws_integration tests)
 # ---------------------------------------------------------------------------
 
+# uvicorn logs the address it actually bound, which is how --port 0 is resolved
+_BOUND_RE = re.compile(r"Uvicorn running on http://127\.0\.0\.1:(\d+)")
+
+
+def _watch_server_log(stream, ports: queue.Queue) -> None:
+    """Report the port uvicorn bound, then forward its non-INFO log lines.
+
+    Runs on a daemon thread for the server's lifetime so its stderr pipe
+    never fills up; puts None once the server exits.
+    """
+    for line in stream:
+        match = _BOUND_RE.search(line)
+        if match:
+            ports.put(int(match.group(1)))
+        elif not line.startswith("INFO:"):
+            sys.stderr.write(line)
+    ports.put(None)
+
+
 @pytest.fixture(scope="session")
 def live_server():
-    """Start a real uvicorn process on port 18000; yield; stop it.
+    """Start a real uvicorn process on an OS-assigned port; yield its URLs; stop it.
 
-    Port 18000 avoids clashing with a dev server on 8000.
-    Session-scoped so the server starts once for the entire test session.
+    Session-scoped so the server starts once for the entire test session;
+    ready once its startup line is logged and GET /healthz answers 200.
+    uvicorn binds port 0 itself and the fixture reads the port back from its
+    startup line, so each pytest-xdist worker (and each concurrent pytest
+    run) gets its own server with no window for another process to take
+    the port.  Yields ``SimpleNamespace(http=..., ws=...)`` base URLs.
+    Bots run in fast mode (POKER_FAST_BOTS=1) so hands finish without
+    real-time think delays.
     """
-    port = 18000
+    env = {**os.environ, "POKER_FAST_BOTS": "1"}
     proc = subprocess.Popen(
         [
             sys.executable, "-m", "uvicorn", "app.main:app",
             "--host", "127.0.0.1",
-            "--port", str(port),
-            "--log-level", "warning",
+            "--port", "0",
+            "--log-level", "info",
+            "--no-access-log",
+            "--no-use-colors",
         ],
+        env=env,
+        stderr=subprocess.PIPE,
+        text=True,
     )
-    # Poll until port is accepting connections (up to 6 s)
-    deadline = time.time() + 6
-    while time.time() < deadline:
-        try:
-            s = socket.create_connection(("127.0.0.1", port), timeout=0.5)
-            s.close()
-            break
-        except OSError:
-            time.sleep(0.2)
-    else:
+    ports: queue.Queue = queue.Queue()
+    threading.Thread(
+        target=_watch_server_log, args=(proc.stderr, ports), daemon=True,
+    ).start()
+    # The startup line comes after the app has started and the socket is bound
+    try:
+        port = ports.get(timeout=5)
+    except queue.Empty:
+        port = None
+    if port is None or httpx.get(
+        f"http://127.0.0.1:{port}/healthz", timeout=5,
+    ).status_code != 200:
         proc.terminate()
-        raise RuntimeError("uvicorn did not start in time on port 18000")
+        raise RuntimeError("uvicorn did not start in time")
 
-    yield proc
+    yield SimpleNamespace(
+        http=f"http://127.0.0.1:{port}",
+        ws=f"ws://127.0.0.1:{port}",
+    )
 
     proc.terminate()
     proc.wait()
@@ -1,8 +1,23 @@
 import re
 
 import pytest
+from playwright.sync_api import expect
 
-BASE_URL = "http://127.0.0.1:18000"
+GAME_URL_RE = re.compile(r".*/game/.*")
+
+# One default for every action, navigation and expect() in the e2e suite.
+# The live server runs bots in fast mode, so no step needs longer.
+DEFAULT_TIMEOUT_MS = 15_000
+
+expect.set_options(timeout=DEFAULT_TIMEOUT_MS)
+
+
+@pytest.fixture
+def context(context):
+    """pytest-playwright's context with the suite-wide default timeouts."""
+    context.set_default_timeout(DEFAULT_TIMEOUT_MS)
+    context.set_default_navigation_timeout(DEFAULT_TIMEOUT_MS)
+    return context
 
 
 @pytest.fixture
@@ -13,10 +28,10 @@ def game_page(page, live_server):
     submits, and waits for the game page URL. Returns the Page object
     already on /game/{game_id}.
     """
-    page.goto(BASE_URL)
+    page.goto(live_server.http)
     page.fill("#player-name", "GUITester")
     page.select_option("#num-bots", "3")
     page.select_option("#bot-difficulty", "easy")
     page.locator("#create-game-form button[type='submit']").click()
-    page.wait_for_url(re.compile(r".*/game/.*"), timeout=15_000)
+    page.wait_for_url(GAME_URL_RE)
     return page
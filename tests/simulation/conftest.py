@@ -0,0 +1,17 @@
+"""Simulation-suite configuration: run its asyncio tests on uvloop when available."""
+import sys
+
+import pytest
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop comes with uvicorn[standard]
+    uvloop = None
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Build the session event loop with uvloop (not available on Windows)."""
+    if uvloop is None or sys.platform == "win32":
+        pytest.skip("uvloop is not available on this platform")
+    return uvloop.EventLoopPolicy()
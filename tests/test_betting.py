@@ -11,92 +11,73 @@ def _make_state(
     big_blind=20,
     small_blind=10,
 ) -> GameState:
-    state = GameState(
+    """Players p0..pN-1 in seats 0..N-1; current_player_index defaults to 0 (p0 acts)."""
+    return GameState(
         game_id="test",
         variant=variant,
         small_blind=small_blind,
         big_blind=big_blind,
         max_players=9,
+        players=[
+            PlayerState(player_id=f"p{i}", name=f"Player {i}", chips=chips, seat=i)
+            for i in range(num_players)
+        ],
     )
-    for i in range(num_players):
-        state.players.append(PlayerState(
-            player_id=f"p{i}",
-            name=f"Player {i}",
-            chips=chips,
-            seat=i,
-        ))
-    return state
 
 
-class TestGetValidActions:
-    def test_can_check_when_no_bet(self):
-        state = _make_state()
-        br = BettingRound(state, 0, GamePhase.FLOP)
-        valid = br.get_valid_actions("p0")
-        assert valid.can_check is True
-        assert valid.call_amount == 0
-
-    def test_must_call_when_bet_exists(self):
-        state = _make_state()
-        state.players[1].bet = 40
-        br = BettingRound(state, 0, GamePhase.FLOP)
-        valid = br.get_valid_actions("p0")
-        assert valid.can_check is False
-        assert valid.call_amount == 40
-
-    def test_call_amount_capped_at_stack(self):
-        state = _make_state(chips=30)
-        state.players[1].bet = 100
-        br = BettingRound(state, 0, GamePhase.FLOP)
-        valid = br.get_valid_actions("p0")
-        assert valid.call_amount == 30  # capped at stack
-
-    def test_nlhe_min_raise(self):
-        state = _make_state()
-        br = BettingRound(state, 0, GamePhase.PREFLOP)
-        valid = br.get_valid_actions("p0")
-        # min raise = current_bet + max(last_raise_size, BB) = 0 + 20 = 20
-        assert valid.min_raise == 20
-        assert valid.max_raise == 1000  # stack + bet (0)
-        assert valid.can_raise is True
-
-    def test_nlhe_min_raise_after_raise(self):
-        state = _make_state()
-        state.players[0].bet = 60
-        br = BettingRound(state, 0, GamePhase.PREFLOP)
-        br._current_bet = 60
-        br._last_raise_size = 40  # raised by 40 over 20
-        valid = br.get_valid_actions("p1")
-        # min raise = 60 + max(40, 20) = 100
-        assert valid.min_raise == 100
-
-    def test_flhe_fixed_bet_preflop(self):
-        state = _make_state(variant=GameVariant.FIXED_LIMIT)
-        br = BettingRound(state, 0, GamePhase.PREFLOP)
-        valid = br.get_valid_actions("p0")
-        assert valid.min_raise == 20  # 0 + 1*BB
-        assert valid.max_raise == 20  # fixed
-
-    def test_flhe_fixed_bet_turn(self):
-        state = _make_state(variant=GameVariant.FIXED_LIMIT)
-        br = BettingRound(state, 0, GamePhase.TURN)
-        valid = br.get_valid_actions("p0")
-        assert valid.min_raise == 40  # 0 + 2*BB
-        assert valid.max_raise == 40
+# Each case: _make_state kwargs, {seat: outstanding bet}, phase,
+# BettingRound attributes to override, acting player, expected ValidActions fields.
+_VALID_ACTION_CASES = [
+    pytest.param({}, {}, GamePhase.FLOP, {}, "p0",
+                 {"can_check": True, "call_amount": 0},
+                 id="can_check_when_no_bet"),
+    pytest.param({}, {1: 40}, GamePhase.FLOP, {}, "p0",
+                 {"can_check": False, "call_amount": 40},
+                 id="must_call_when_bet_exists"),
+    pytest.param({"chips": 30}, {1: 100}, GamePhase.FLOP, {}, "p0",
+                 {"call_amount": 30},  # capped at stack
+                 id="call_amount_capped_at_stack"),
+    # min raise = current_bet + max(last_raise_size, BB) = 0 + 20 = 20;
+    # max raise = stack + bet (0)
+    pytest.param({}, {}, GamePhase.PREFLOP, {}, "p0",
+                 {"min_raise": 20, "max_raise": 1000, "can_raise": True},
+                 id="nlhe_min_raise"),
+    # p0 raised by 40 over 20: min raise = 60 + max(40, 20) = 100
+    pytest.param({}, {0: 60}, GamePhase.PREFLOP,
+                 {"_current_bet": 60, "_last_raise_size": 40}, "p1",
+                 {"min_raise": 100},
+                 id="nlhe_min_raise_after_raise"),
+    pytest.param({"variant": GameVariant.FIXED_LIMIT}, {}, GamePhase.PREFLOP, {}, "p0",
+                 {"min_raise": 20, "max_raise": 20},  # 0 + 1*BB, fixed
+                 id="flhe_fixed_bet_preflop"),
+    pytest.param({"variant": GameVariant.FIXED_LIMIT}, {}, GamePhase.TURN, {}, "p0",
+                 {"min_raise": 40, "max_raise": 40},  # 0 + 2*BB, fixed
+                 id="flhe_fixed_bet_turn"),
+    pytest.param({"variant": GameVariant.FIXED_LIMIT}, {}, GamePhase.FLOP,
+                 {"_num_raises": 4}, "p0",
+                 {"can_raise": False},
+                 id="flhe_raise_cap"),
+    pytest.param({"chips": 50}, {1: 50}, GamePhase.FLOP, {}, "p0",
+                 {"can_raise": False},
+                 id="cannot_raise_when_no_chips_beyond_call"),
+]
 
-    def test_flhe_raise_cap(self):
-        state = _make_state(variant=GameVariant.FIXED_LIMIT)
-        br = BettingRound(state, 0, GamePhase.FLOP)
-        br._num_raises = 4
-        valid = br.get_valid_actions("p0")
-        assert valid.can_raise is False
 
-    def test_cannot_raise_when_no_chips_beyond_call(self):
-        state = _make_state(chips=50)
-        state.players[1].bet = 50
-        br = BettingRound(state, 0, GamePhase.FLOP)
-        valid = br.get_valid_actions("p0")
-        assert valid.can_raise is False
+class TestGetValidActions:
+    @pytest.mark.parametrize(
+        "state_kwargs, bets, phase, round_attrs, player_id, expected",
+        _VALID_ACTION_CASES,
+    )
+    def test_valid_actions(self, state_kwargs, bets, phase, round_attrs, player_id, expected):
+        state = _make_state(**state_kwargs)
+        for seat, amount in bets.items():
+            state.players[seat].bet = amount
+        br = BettingRound(state, 0, phase)
+        for attr, value in round_attrs.items():
+            setattr(br, attr, value)
+        valid = br.get_valid_actions(player_id)
+        actual = {field: getattr(valid, field) for field in expected}
+        assert actual == expected
 
     def test_player_not_found_raises(self):
         state = _make_state()
@@ -108,7 +89,6 @@ class TestGetValidActions:
 class TestApplyAction:
     def test_fold(self):
         state = _make_state()
-        state.current_player_index = 0
         br = BettingRound(state, 0, GamePhase.FLOP)
         result = br.apply_action("p0", BettingAction.FOLD)
         assert state.players[0].is_folded is True
@@ -117,14 +97,12 @@ class TestApplyAction:
 
     def test_fold_leaves_one_player(self):
         state = _make_state(num_players=2)
-        state.current_player_index = 0
         br = BettingRound(state, 0, GamePhase.FLOP)
         result = br.apply_action("p0", BettingAction.FOLD)
         assert result == BettingResult.ALL_FOLDED
 
     def test_check(self):
         state = _make_state()
-        state.current_player_index = 0
         br = BettingRound(state, 0, GamePhase.FLOP)
         result = br.apply_action("p0", BettingAction.CHECK)
         assert result == BettingResult.CONTINUE
@@ -132,7 +110,6 @@ class TestApplyAction:
     def test_check_invalid_raises(self):
         state = _make_state()
         state.players[1].bet = 40
-        state.current_player_index = 0
         br = BettingRound(state, 0, GamePhase.FLOP)
         with pytest.raises(ValueError, match="cannot check"):
             br.apply_action("p0", BettingAction.CHECK)
@@ -141,7 +118,6 @@ class TestApplyAction:
         state = _make_state()
         state.players[1].bet = 40
         state.pot = 40
-        state.current_player_index = 0
         br = BettingRound(state, 0, GamePhase.FLOP)
         result = br.apply_action("p0", BettingAction.CALL)
         assert state.players[0].chips == 960
@@ -153,7 +129,6 @@ class TestApplyAction:
         state = _make_state(chips=30)
         state.players[1].bet = 100
         state.pot = 100
-        state.current_player_index = 0
         br = BettingRound(state, 0, GamePhase.FLOP)
         br.apply_action("p0", BettingAction.CALL)
         assert state.players[0].chips == 0
@@ -162,7 +137,6 @@ class TestApplyAction:
 
     def test_raise_nlhe(self):
         state = _make_state()
-        state.current_player_index = 0
         br = BettingRound(state, 0, GamePhase.FLOP)
         result = br.apply_action("p0", BettingAction.RAISE, 60)
         assert state.players[0].bet == 60
@@ -175,7 +149,6 @@ class TestApplyAction:
 
     def test_raise_enforces_minimum(self):
         state = _make_state()
-        state.current_player_index = 0
         br = BettingRound(state, 0, GamePhase.FLOP)
         # Try raising to 5 (below min_raise of 20)
         br.apply_action("p0", BettingAction.RAISE, 5)
@@ -183,7 +156,6 @@ class TestApplyAction:
 
     def test_all_in_action(self):
         state = _make_state(chips=500)
-        state.current_player_index = 0
         br = BettingRound(state, 0, GamePhase.FLOP)
         br.apply_action("p0", BettingAction.ALL_IN)
         assert state.players[0].chips == 0
@@ -192,38 +164,30 @@ class TestApplyAction:
 
     def test_player_not_found_raises(self):
         state = _make_state()
-        state.current_player_index = 0
         br = BettingRound(state, 0, GamePhase.FLOP)
         with pytest.raises(ValueError):
             br.apply_action("unknown", BettingAction.FOLD)
 
 
-class TestNextToAct:
-    def test_returns_player_id(self):
-        state = _make_state()
-        state.current_player_index = 1
-        br = BettingRound(state, 1, GamePhase.FLOP)
-        assert br.next_to_act() == "p1"
-
-    def test_returns_none_when_folded(self):
-        state = _make_state()
-        state.current_player_index = 0
-        state.players[0].is_folded = True
-        br = BettingRound(state, 0, GamePhase.FLOP)
-        assert br.next_to_act() is None
+# Each case: current_player_index, BettingRound start index, PlayerState flag
+# set on p0 (or None), expected next_to_act().
+_NEXT_TO_ACT_CASES = [
+    pytest.param(1, 1, None, "p1", id="returns_player_id"),
+    pytest.param(0, 0, "is_folded", None, id="returns_none_when_folded"),
+    pytest.param(0, 0, "is_all_in", None, id="returns_none_when_all_in"),
+    pytest.param(-1, 0, None, None, id="returns_none_index_neg1"),
+]
 
-    def test_returns_none_when_all_in(self):
-        state = _make_state()
-        state.current_player_index = 0
-        state.players[0].is_all_in = True
-        br = BettingRound(state, 0, GamePhase.FLOP)
-        assert br.next_to_act() is None
 
-    def test_returns_none_index_neg1(self):
+class TestNextToAct:
+    @pytest.mark.parametrize("current_index, start, flag, expected", _NEXT_TO_ACT_CASES)
+    def test_next_to_act(self, current_index, start, flag, expected):
         state = _make_state()
-        state.current_player_index = -1
-        br = BettingRound(state, 0, GamePhase.FLOP)
-        assert br.next_to_act() is None
+        state.current_player_index = current_index
+        if flag:
+            setattr(state.players[0], flag, True)
+        br = BettingRound(state, start, GamePhase.FLOP)
+        assert br.next_to_act() == expected
 
 
 class TestCurrentBet:
@@ -242,7 +206,6 @@ class TestCurrentBet:
 class TestRoundCompletion:
     def test_all_check_completes(self):
         state = _make_state(num_players=2)
-        state.current_player_index = 0
         br = BettingRound(state, 0, GamePhase.FLOP)
         r1 = br.apply_action("p0", BettingAction.CHECK)
         assert r1 == BettingResult.CONTINUE
@@ -251,7 +214,6 @@ class TestRoundCompletion:
 
     def test_call_completes_round(self):
         state = _make_state(num_players=2)
-        state.current_player_index = 0
         br = BettingRound(state, 0, GamePhase.FLOP)
         br.apply_action("p0", BettingAction.RAISE, 40)
         r = br.apply_action("p1", BettingAction.CALL)
@@ -259,7 +221,6 @@ class TestRoundCompletion:
 
     def test_all_in_vs_one_completes(self):
         state = _make_state(num_players=2, chips=100)
-        state.current_player_index = 0
         br = BettingRound(state, 0, GamePhase.FLOP)
         br.apply_action("p0", BettingAction.ALL_IN)
         r = br.apply_action("p1", BettingAction.CALL)
@@ -267,7 +228,6 @@ class TestRoundCompletion:
 
     def test_reraise_continues(self):
         state = _make_state(num_players=2)
-        state.current_player_index = 0
         br = BettingRound(state, 0, GamePhase.FLOP)
         br.apply_action("p0", BettingAction.RAISE, 40)
         r = br.apply_action("p1", BettingAction.RAISE, 80)
@@ -275,7 +235,6 @@ class TestRoundCompletion:
 
     def test_all_folded_except_one(self):
         state = _make_state(num_players=3)
-        state.current_player_index = 0
         br = BettingRound(state, 0, GamePhase.FLOP)
         br.apply_action("p0", BettingAction.FOLD)
         r = br.apply_action("p1", BettingAction.FOLD)
@@ -286,7 +245,6 @@ class TestFLHERaise:
     def test_flhe_raise_uses_fixed_bet(self):
         """FLHE raise: total_bet = current_bet + fixed_bet."""
         state = _make_state(variant=GameVariant.FIXED_LIMIT, big_blind=20)
-        state.current_player_index = 0
         br = BettingRound(state, 0, GamePhase.FLOP)
         # fixed_bet = BB = 20 for flop
         br.apply_action("p0", BettingAction.RAISE)
@@ -294,7 +252,6 @@ class TestFLHERaise:
 
     def test_flhe_raise_turn_doubles(self):
         state = _make_state(variant=GameVariant.FIXED_LIMIT, big_blind=20)
-        state.current_player_index = 0
         br = BettingRound(state, 0, GamePhase.TURN)
         # fixed_bet = 2*BB = 40 for turn
         br.apply_action("p0", BettingAction.RAISE)
@@ -304,7 +261,6 @@ class TestFLHERaise:
 class TestRaiseWhenCantRaise:
     def test_raise_not_allowed_raises_error(self):
         state = _make_state(variant=GameVariant.FIXED_LIMIT, big_blind=20)
-        state.current_player_index = 0
         br = BettingRound(state, 0, GamePhase.FLOP)
         br._num_raises = 4  # at cap
         with pytest.raises(ValueError, match="cannot raise"):
@@ -315,7 +271,6 @@ class TestUnknownAction:
     def test_unknown_action_raises(self):
         """Passing an invalid action string should raise ValueError."""
         state = _make_state()
-        state.current_player_index = 0
         br = BettingRound(state, 0, GamePhase.FLOP)
         with pytest.raises(ValueError, match="Unknown action"):
             br.apply_action("p0", "invalid_action")
@@ -324,7 +279,6 @@ class TestUnknownAction:
 class TestAdvanceWhenNoPlayersCanAct:
     def test_all_folded_or_all_in(self):
         state = _make_state(num_players=3)
-        state.current_player_index = 0
         state.players[1].is_all_in = True
         state.players[2].is_all_in = True
         br = BettingRound(state, 0, GamePhase.FLOP)
@@ -7,6 +7,13 @@ from app.game.betting import BettingAction, ValidActions
 from app.game.game_state import GameState, GameVariant, PlayerState
 
 
+# Hole-card pairs shared by the tests; Cards are immutable, so one instance each.
+_AA  = (Card(Rank.ACE, Suit.SPADES), Card(Rank.ACE, Suit.HEARTS))
+_AKO = (Card(Rank.ACE, Suit.SPADES), Card(Rank.KING, Suit.HEARTS))
+_KQO = (Card(Rank.KING, Suit.SPADES), Card(Rank.QUEEN, Suit.HEARTS))
+_72O = (Card(Rank.SEVEN, Suit.SPADES), Card(Rank.TWO, Suit.HEARTS))
+
+
 def _make_state(num_players=3, pot=100) -> GameState:
     state = GameState(
         game_id="test",
@@ -14,11 +21,11 @@ def _make_state(num_players=3, pot=100) -> GameState:
         small_blind=10,
         big_blind=20,
         max_players=9,
+        players=[
+            PlayerState(player_id=f"p{i}", name=f"Player {i}", chips=1000, seat=i)
+            for i in range(num_players)
+        ],
     )
-    for i in range(num_players):
-        state.players.append(PlayerState(
-            player_id=f"p{i}", name=f"Player {i}", chips=1000, seat=i,
-        ))
     state.pot = pot
     return state
 
@@ -41,6 +48,15 @@ def _make_valid(
     )
 
 
+@pytest.fixture(autouse=True)
+def _seeded_random():
+    """Seed the global RNG for each test and restore its prior state after."""
+    saved = random.getstate()
+    random.seed(42)
+    yield
+    random.setstate(saved)
+
+
 class TestBotPlayer:
     def test_init(self):
         bot = BotPlayer("p0")
@@ -56,44 +72,22 @@ class TestBotPlayer:
         assert action == BettingAction.FOLD
         assert amount == 0
 
-    def test_decide_with_strong_hand(self):
-        random.seed(42)
-        bot = BotPlayer("p0")
-        state = _make_state()
-        player = state.players[0]
-        player.hole_cards = [
-            Card(Rank.ACE, Suit.SPADES),
-            Card(Rank.ACE, Suit.HEARTS),
-        ]
-        valid = _make_valid(can_check=True, can_raise=True)
-        action, amount = bot.decide(state, player, valid, difficulty="medium")
-        # AA preflop should result in raise or check (high equity)
-        assert action in (BettingAction.RAISE, BettingAction.CHECK)
-
     def test_decide_with_weak_hand_folds(self):
-        random.seed(42)
         bot = BotPlayer("p0")
         state = _make_state(pot=10)
         player = state.players[0]
-        player.hole_cards = [
-            Card(Rank.SEVEN, Suit.SPADES),
-            Card(Rank.TWO, Suit.HEARTS),
-        ]
+        player.hole_cards = list(_72O)
         valid = _make_valid(can_check=False, call_amount=100, can_raise=False)
         action, _ = bot.decide(state, player, valid, difficulty="medium")
         # 72o with bad pot odds should fold
         assert action == BettingAction.FOLD
 
     def test_raise_amount_capped_at_stack(self):
-        random.seed(42)
         bot = BotPlayer("p0")
         state = _make_state(pot=500)
         player = state.players[0]
         player.chips = 100
-        player.hole_cards = [
-            Card(Rank.ACE, Suit.SPADES),
-            Card(Rank.ACE, Suit.HEARTS),
-        ]
+        player.hole_cards = list(_AA)
         valid = _make_valid(
             can_check=True,
             can_raise=True,
@@ -106,16 +100,12 @@ class TestBotPlayer:
             assert amount <= player.chips + player.bet
 
     def test_counts_opponents(self):
-        random.seed(42)
         bot = BotPlayer("p0")
         state = _make_state(num_players=4)
         state.players[1].is_folded = True
         state.players[2].is_sitting_out = True
         player = state.players[0]
-        player.hole_cards = [
-            Card(Rank.KING, Suit.SPADES),
-            Card(Rank.QUEEN, Suit.HEARTS),
-        ]
+        player.hole_cards = list(_KQO)
         valid = _make_valid(can_check=True, can_raise=False)
         # Should not crash — opponent count should be 1 (p3 only)
         action, _ = bot.decide(state, player, valid, difficulty="easy")
@@ -123,14 +113,10 @@ class TestBotPlayer:
 
     def test_raise_below_call_becomes_call(self):
         """If strategy says RAISE but amount <= call_amount, fallback to CALL."""
-        random.seed(42)
         bot = BotPlayer("p0")
         state = _make_state(pot=100)
         player = state.players[0]
-        player.hole_cards = [
-            Card(Rank.ACE, Suit.SPADES),
-            Card(Rank.ACE, Suit.HEARTS),
-        ]
+        player.hole_cards = list(_AA)
         # Very small max_raise forces amount to be small
         valid = _make_valid(
             can_check=False,
@@ -145,28 +131,20 @@ class TestBotPlayer:
         if action == BettingAction.CALL:
             assert amount == 50
 
-    def test_difficulty_easy(self):
-        random.seed(42)
-        bot = BotPlayer("p0")
-        state = _make_state()
-        player = state.players[0]
-        player.hole_cards = [
-            Card(Rank.ACE, Suit.SPADES),
-            Card(Rank.KING, Suit.HEARTS),
-        ]
-        valid = _make_valid(can_check=True, can_raise=False)
-        action, _ = bot.decide(state, player, valid, difficulty="easy")
-        assert action == BettingAction.CHECK
-
-    def test_difficulty_hard(self):
-        random.seed(99)
+    @pytest.mark.parametrize("difficulty, seed, hole, can_raise, expected", [
+        pytest.param("easy",   42, _AKO, False, {BettingAction.CHECK}, id="easy"),
+        # AA preflop should result in raise or check (high equity)
+        pytest.param("medium", 42, _AA,  True,  {BettingAction.RAISE, BettingAction.CHECK},
+                     id="medium_strong_hand"),
+        pytest.param("hard",   99, _AA,  True,  {BettingAction.CHECK, BettingAction.RAISE},
+                     id="hard"),
+    ])
+    def test_difficulty(self, difficulty, seed, hole, can_raise, expected):
+        random.seed(seed)
         bot = BotPlayer("p0")
         state = _make_state()
         player = state.players[0]
-        player.hole_cards = [
-            Card(Rank.ACE, Suit.SPADES),
-            Card(Rank.ACE, Suit.HEARTS),
-        ]
-        valid = _make_valid(can_check=True, can_raise=True)
-        action, _ = bot.decide(state, player, valid, difficulty="hard")
-        assert action in (BettingAction.CHECK, BettingAction.RAISE)
+        player.hole_cards = list(hole)
+        valid = _make_valid(can_check=True, can_raise=can_raise)
+        action, _ = bot.decide(state, player, valid, difficulty=difficulty)
+        assert action in expected
@@ -1,154 +1,145 @@
 """Unit tests for connection_manager.py — ConnectionManager."""
-import asyncio
-from unittest.mock import AsyncMock, MagicMock
+import pytest
+
 from app.managers.connection_manager import ConnectionManager
 
 
-def _mock_ws():
-    """Create a mock WebSocket."""
-    ws = AsyncMock()
-    ws.accept = AsyncMock()
-    ws.send_json = AsyncMock()
-    return ws
+class _FakeWebSocket:
+    """Minimal stand-in for a WebSocket: records accepts and sent messages.
+
+    Set ``fail`` to an exception to make ``send_json`` raise it.
+    """
+
+    def __init__(self) -> None:
+        self.accepted = 0
+        self.sent: list = []
+        self.fail = None
+
+    async def accept(self) -> None:
+        self.accepted += 1
+
+    async def send_json(self, message) -> None:
+        if self.fail is not None:
+            raise self.fail
+        self.sent.append(message)
+
+
+@pytest.fixture
+def cm():
+    """A fresh, empty ConnectionManager for each test."""
+    return ConnectionManager()
 
 
 class TestConnect:
-    def test_connect_and_is_connected(self):
-        async def _run():
-            cm = ConnectionManager()
-            ws = _mock_ws()
-            await cm.connect("game1", "p1", ws)
-            assert cm.is_connected("game1", "p1") is True
-            ws.accept.assert_awaited_once()
-        asyncio.run(_run())
-
-    def test_connect_multiple_players(self):
-        async def _run():
-            cm = ConnectionManager()
-            ws1 = _mock_ws()
-            ws2 = _mock_ws()
-            await cm.connect("game1", "p1", ws1)
-            await cm.connect("game1", "p2", ws2)
-            assert cm.player_count("game1") == 2
-        asyncio.run(_run())
-
-    def test_not_connected(self):
-        cm = ConnectionManager()
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_connect_and_is_connected(self, cm):
+        ws = _FakeWebSocket()
+        await cm.connect("game1", "p1", ws)
+        assert cm.is_connected("game1", "p1") is True
+        assert ws.accepted == 1
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_connect_multiple_players(self, cm):
+        ws1 = _FakeWebSocket()
+        ws2 = _FakeWebSocket()
+        await cm.connect("game1", "p1", ws1)
+        await cm.connect("game1", "p2", ws2)
+        assert cm.player_count("game1") == 2
+
+    def test_not_connected(self, cm):
         assert cm.is_connected("game1", "p1") is False
 
 
 class TestDisconnect:
-    def test_disconnect(self):
-        async def _run():
-            cm = ConnectionManager()
-            ws = _mock_ws()
-            await cm.connect("game1", "p1", ws)
-            cm.disconnect("game1", "p1")
-            assert cm.is_connected("game1", "p1") is False
-        asyncio.run(_run())
-
-    def test_disconnect_removes_empty_game(self):
-        async def _run():
-            cm = ConnectionManager()
-            ws = _mock_ws()
-            await cm.connect("game1", "p1", ws)
-            cm.disconnect("game1", "p1")
-            assert cm.player_count("game1") == 0
-        asyncio.run(_run())
-
-    def test_disconnect_nonexistent_noop(self):
-        cm = ConnectionManager()
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_disconnect(self, cm):
+        ws = _FakeWebSocket()
+        await cm.connect("game1", "p1", ws)
+        cm.disconnect("game1", "p1")
+        assert cm.is_connected("game1", "p1") is False
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_disconnect_removes_empty_game(self, cm):
+        ws = _FakeWebSocket()
+        await cm.connect("game1", "p1", ws)
+        cm.disconnect("game1", "p1")
+        assert cm.player_count("game1") == 0
+
+    def test_disconnect_nonexistent_noop(self, cm):
         cm.disconnect("game1", "p1")  # should not raise
 
 
 class TestSendPersonal:
-    def test_send_to_connected_player(self):
-        async def _run():
-            cm = ConnectionManager()
-            ws = _mock_ws()
-            await cm.connect("game1", "p1", ws)
-            await cm.send_personal("game1", "p1", "test_event", {"key": "val"})
-            ws.send_json.assert_awaited_with({"type": "test_event", "payload": {"key": "val"}})
-        asyncio.run(_run())
-
-    def test_send_to_disconnected_noop(self):
-        async def _run():
-            cm = ConnectionManager()
-            # Should not raise
-            await cm.send_personal("game1", "p1", "test", {})
-        asyncio.run(_run())
-
-    def test_send_error_disconnects(self):
-        async def _run():
-            cm = ConnectionManager()
-            ws = _mock_ws()
-            ws.send_json.side_effect = Exception("connection lost")
-            await cm.connect("game1", "p1", ws)
-            await cm.send_personal("game1", "p1", "test", {})
-            assert cm.is_connected("game1", "p1") is False
-        asyncio.run(_run())
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_send_to_connected_player(self, cm):
+        ws = _FakeWebSocket()
+        await cm.connect("game1", "p1", ws)
+        await cm.send_personal("game1", "p1", "test_event", {"key": "val"})
+        assert ws.sent == [{"type": "test_event", "payload": {"key": "val"}}]
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_send_to_disconnected_noop(self, cm):
+        # Should not raise
+        await cm.send_personal("game1", "p1", "test", {})
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_send_error_disconnects(self, cm):
+        ws = _FakeWebSocket()
+        ws.fail = Exception("connection lost")
+        await cm.connect("game1", "p1", ws)
+        await cm.send_personal("game1", "p1", "test", {})
+        assert cm.is_connected("game1", "p1") is False
 
 
 class TestBroadcastPersonalized:
-    def test_sends_to_all_players(self):
-        async def _run():
-            cm = ConnectionManager()
-            ws1 = _mock_ws()
-            ws2 = _mock_ws()
-            await cm.connect("game1", "p1", ws1)
-            await cm.connect("game1", "p2", ws2)
-            await cm.broadcast_personalized(
-                "game1",
-                "update",
-                lambda pid: {"for": pid},
-            )
-            ws1.send_json.assert_awaited_with({"type": "update", "payload": {"for": "p1"}})
-            ws2.send_json.assert_awaited_with({"type": "update", "payload": {"for": "p2"}})
-        asyncio.run(_run())
-
-    def test_skips_none_payloads(self):
-        async def _run():
-            cm = ConnectionManager()
-            ws1 = _mock_ws()
-            ws2 = _mock_ws()
-            await cm.connect("game1", "p1", ws1)
-            await cm.connect("game1", "p2", ws2)
-            # Only send to p1
-            await cm.broadcast_personalized(
-                "game1",
-                "update",
-                lambda pid: {"data": 1} if pid == "p1" else None,
-            )
-            ws1.send_json.assert_awaited()
-            ws2.send_json.assert_not_awaited()
-        asyncio.run(_run())
-
-    def test_empty_game_noop(self):
-        async def _run():
-            cm = ConnectionManager()
-            await cm.broadcast_personalized("game1", "test", lambda pid: {"x": 1})
-        asyncio.run(_run())
-
-    def test_safe_send_error_disconnects(self):
-        async def _run():
-            cm = ConnectionManager()
-            ws = _mock_ws()
-            ws.send_json.side_effect = Exception("broken pipe")
-            await cm.connect("game1", "p1", ws)
-            await cm.broadcast_personalized("game1", "test", lambda pid: {"x": 1})
-            assert cm.is_connected("game1", "p1") is False
-        asyncio.run(_run())
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_sends_to_all_players(self, cm):
+        ws1 = _FakeWebSocket()
+        ws2 = _FakeWebSocket()
+        await cm.connect("game1", "p1", ws1)
+        await cm.connect("game1", "p2", ws2)
+        await cm.broadcast_personalized(
+            "game1",
+            "update",
+            lambda pid: {"for": pid},
+        )
+        assert ws1.sent == [{"type": "update", "payload": {"for": "p1"}}]
+        assert ws2.sent == [{"type": "update", "payload": {"for": "p2"}}]
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_skips_none_payloads(self, cm):
+        ws1 = _FakeWebSocket()
+        ws2 = _FakeWebSocket()
+        await cm.connect("game1", "p1", ws1)
+        await cm.connect("game1", "p2", ws2)
+        # Only send to p1
+        await cm.broadcast_personalized(
+            "game1",
+            "update",
+            lambda pid: {"data": 1} if pid == "p1" else None,
+        )
+        assert ws1.sent == [{"type": "update", "payload": {"data": 1}}]
+        assert ws2.sent == []
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_empty_game_noop(self, cm):
+        await cm.broadcast_personalized("game1", "test", lambda pid: {"x": 1})
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_safe_send_error_disconnects(self, cm):
+        ws = _FakeWebSocket()
+        ws.fail = Exception("broken pipe")
+        await cm.connect("game1", "p1", ws)
+        await cm.broadcast_personalized("game1", "test", lambda pid: {"x": 1})
+        assert cm.is_connected("game1", "p1") is False
 
 
 class TestPlayerCount:
-    def test_empty(self):
-        cm = ConnectionManager()
+    def test_empty(self, cm):
         assert cm.player_count("game1") == 0
 
-    def test_after_connect(self):
-        async def _run():
-            cm = ConnectionManager()
-            ws = _mock_ws()
-            await cm.connect("game1", "p1", ws)
-            assert cm.player_count("game1") == 1
-        asyncio.run(_run())
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_after_connect(self, cm):
+        ws = _FakeWebSocket()
+        await cm.connect("game1", "p1", ws)
+        assert cm.player_count("game1") == 1
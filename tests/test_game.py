@@ -1,9 +1,10 @@
 """Unit tests for game.py — PokerGame orchestrator."""
 import asyncio
+import random
 import pytest
 
 from app.core.card import Card, Rank, Suit
-from app.game.betting import BettingAction
+from app.game.betting import BettingAction, BettingRound
 from app.game.game import PokerGame
 from app.game.game_state import GamePhase, GameVariant, PlayerState
 from app.game.player import Player
@@ -23,6 +24,26 @@ def _make_game(num_players=3, chips=1000) -> PokerGame:
     return game
 
 
+def _players_by_id(payload) -> dict:
+    return {p["player_id"]: p for p in payload["players"]}
+
+
+class _RecordingBroadcast:
+    """Stands in for the broadcast callback; records each event as seen by `viewer`."""
+
+    def __init__(self, viewer: str = "p0"):
+        self.viewer = viewer
+        self.calls = []
+
+    async def __call__(self, game_id, event_type, factory) -> None:
+        self.calls.append((event_type, factory(self.viewer)))
+
+
+@pytest.fixture
+def broadcast():
+    return _RecordingBroadcast()
+
+
 class TestAddPlayer:
     def test_add_player_success(self):
         game = _make_game(num_players=0)
@@ -98,7 +119,7 @@ class TestGetStateForPlayer:
 
         payload = game.get_state_for_player("p0")
         # Own cards revealed
-        p0_data = [p for p in payload["players"] if p["player_id"] == "p0"][0]
+        p0_data = _players_by_id(payload)["p0"]
         assert p0_data["hole_cards"] == ["As", "Kh"]
 
     def test_opponent_cards_masked(self):
@@ -114,7 +135,7 @@ class TestGetStateForPlayer:
         ]
 
         payload = game.get_state_for_player("p0")
-        p1_data = [p for p in payload["players"] if p["player_id"] == "p1"][0]
+        p1_data = _players_by_id(payload)["p1"]
         assert p1_data["hole_cards"] == ["??", "??"]
 
     def test_payload_includes_game_info(self):
@@ -127,38 +148,88 @@ class TestGetStateForPlayer:
 
 
 class TestSubmitAction:
-    def test_submit_sets_event(self):
-        async def _run():
-            game = _make_game(num_players=2)
-            await game.submit_action("p0", BettingAction.FOLD)
-            assert game._pending_action == ("p0", BettingAction.FOLD, 0)
-        asyncio.run(_run())
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_submit_sets_event(self):
+        game = _make_game(num_players=2)
+        await game.submit_action("p0", BettingAction.FOLD)
+        assert game._pending_action == ("p0", BettingAction.FOLD, 0)
 
-    def test_submit_with_amount(self):
-        async def _run():
-            game = _make_game(num_players=2)
-            await game.submit_action("p0", BettingAction.RAISE, 100)
-            assert game._pending_action == ("p0", BettingAction.RAISE, 100)
-        asyncio.run(_run())
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_submit_with_amount(self):
+        game = _make_game(num_players=2)
+        await game.submit_action("p0", BettingAction.RAISE, 100)
+        assert game._pending_action == ("p0", BettingAction.RAISE, 100)
 
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_out_of_turn_submission_is_ignored(self):
+        game = _make_game(num_players=2)
+        game._acting_player_id = "p1"
+        await game.submit_action("p0", BettingAction.FOLD)
+        assert game._pending_action is None
 
-class TestAwardToLastRemaining:
-    def test_awards_pot_to_sole_survivor(self):
-        async def _run():
-            game = _make_game(num_players=2)
-            game.state.pot = 100
-            game.state.players[0].is_folded = True
-            broadcast_calls = []
 
-            async def mock_broadcast(game_id, event_type, factory):
-                broadcast_calls.append((event_type, factory("p1")))
+class TestWaitForAction:
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_action_submitted_before_wait_is_not_lost(self):
+        game = _make_game(num_players=2)
+        await game.submit_action("p0", BettingAction.CHECK)
+        result = await asyncio.wait_for(game._wait_for_action("p0"), timeout=1)
+        assert result == ("p0", BettingAction.CHECK, 0)
+        assert game._pending_action is None
 
-            game.set_broadcast(mock_broadcast)
-            await game._award_to_last_remaining()
-            assert game.state.players[1].chips == 1100
-            assert game.state.pot == 0
-            assert broadcast_calls[0][0] == "winner"
-        asyncio.run(_run())
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_stale_action_is_discarded_when_prompting(self):
+        game = _make_game(num_players=2)
+        await game.submit_action("p0", BettingAction.FOLD)
+        betting = BettingRound(game.state, 0, GamePhase.PREFLOP)
+        await game._prompt_player("p0", betting)
+        assert game._pending_action is None
+        assert game._acting_player_id == "p0"
+
+
+class TestRngSeed:
+    def test_same_seed_deals_same_cards_without_touching_global_random(self):
+        before = random.getstate()
+        decks = []
+        for _ in range(2):
+            game = PokerGame("seeded", GameVariant.NO_LIMIT, 10, 20, rng_seed=7)
+            game._deck.reset()
+            decks.append(game._deck.deal(9))
+        assert decks[0] == decks[1]
+        assert random.getstate() == before
+
+
+class TestStop:
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_stop_cancels_loop_and_pending_bot_actions(self):
+        game = _make_game(num_players=2)
+        await game.start()
+        loop_task = game._hand_task
+        bot_task = asyncio.create_task(asyncio.sleep(60))
+        game._bot_tasks.add(bot_task)
+        await game.stop()
+        assert game._hand_task is None
+        assert loop_task.cancelled()
+        assert bot_task.cancelled()
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_stop_before_start_is_noop(self):
+        game = _make_game(num_players=2)
+        await game.stop()
+        assert game._hand_task is None
+
+
+class TestAwardToLastRemaining:
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_awards_pot_to_sole_survivor(self, broadcast):
+        game = _make_game(num_players=2)
+        game.state.pot = 100
+        game.state.players[0].is_folded = True
+        broadcast.viewer = "p1"
+        game.set_broadcast(broadcast)
+        await game._award_to_last_remaining()
+        assert (game.state.players[1].chips, game.state.pot) == (1100, 0)
+        assert broadcast.calls[0][0] == "winner"
 
 
 class TestResetStreetBets:
@@ -193,111 +264,93 @@ class TestStatePayloadFactory:
         game = _make_game(num_players=2)
         game.state.current_player_index = 0
         payload = game._state_payload_factory("p0")
-        p0 = [p for p in payload["players"] if p["player_id"] == "p0"][0]
-        p1 = [p for p in payload["players"] if p["player_id"] == "p1"][0]
+        by_id = _players_by_id(payload)
+        p0, p1 = by_id["p0"], by_id["p1"]
         assert p0["is_active"] is True
         assert p1["is_active"] is False
 
 
 class TestShowdown:
-    def test_showdown_awards_best_hand(self):
-        async def _run():
-            game = _make_game(num_players=2)
-            game.state.pot = 200
-            game.state.community_cards = [
-                Card(Rank.TEN, Suit.HEARTS),
-                Card(Rank.JACK, Suit.HEARTS),
-                Card(Rank.QUEEN, Suit.HEARTS),
-                Card(Rank.TWO, Suit.CLUBS),
-                Card(Rank.THREE, Suit.DIAMONDS),
-            ]
-            # p0 gets a pair of aces
-            game.state.players[0].hole_cards = [
-                Card(Rank.ACE, Suit.SPADES),
-                Card(Rank.ACE, Suit.CLUBS),
-            ]
-            # p1 gets a weak hand
-            game.state.players[1].hole_cards = [
-                Card(Rank.FOUR, Suit.SPADES),
-                Card(Rank.FIVE, Suit.CLUBS),
-            ]
-
-            broadcast_calls = []
-
-            async def mock_broadcast(game_id, event_type, factory):
-                broadcast_calls.append((event_type, factory("p0")))
-
-            game.set_broadcast(mock_broadcast)
-            await game._run_showdown()
-            # p0 had better hand, should win pot
-            assert game.state.pot == 0
-            total_chips = game.state.players[0].chips + game.state.players[1].chips
-            assert total_chips == 2200  # 2000 starting + 200 pot
-        asyncio.run(_run())
-
-    def test_showdown_split_pot_on_tie(self):
-        async def _run():
-            game = _make_game(num_players=2)
-            game.state.pot = 200
-            game.state.community_cards = [
-                Card(Rank.ACE, Suit.HEARTS),
-                Card(Rank.KING, Suit.HEARTS),
-                Card(Rank.QUEEN, Suit.HEARTS),
-                Card(Rank.JACK, Suit.HEARTS),
-                Card(Rank.TEN, Suit.HEARTS),
-            ]
-            # Both players have the same hand (community cards dominate)
-            game.state.players[0].hole_cards = [
-                Card(Rank.TWO, Suit.SPADES),
-                Card(Rank.THREE, Suit.CLUBS),
-            ]
-            game.state.players[1].hole_cards = [
-                Card(Rank.FOUR, Suit.SPADES),
-                Card(Rank.FIVE, Suit.CLUBS),
-            ]
-
-            async def mock_broadcast(game_id, event_type, factory):
-                pass
-
-            game.set_broadcast(mock_broadcast)
-            await game._run_showdown()
-            assert game.state.pot == 0
-            # Both should have gotten 100 each (split)
-            assert game.state.players[0].chips == 1100
-            assert game.state.players[1].chips == 1100
-        asyncio.run(_run())
-
-    def test_showdown_winner_info(self):
-        async def _run():
-            game = _make_game(num_players=2)
-            game.state.pot = 200
-            game.state.community_cards = [
-                Card(Rank.TEN, Suit.HEARTS),
-                Card(Rank.JACK, Suit.HEARTS),
-                Card(Rank.QUEEN, Suit.HEARTS),
-                Card(Rank.TWO, Suit.CLUBS),
-                Card(Rank.THREE, Suit.DIAMONDS),
-            ]
-            game.state.players[0].hole_cards = [
-                Card(Rank.ACE, Suit.SPADES),
-                Card(Rank.ACE, Suit.CLUBS),
-            ]
-            game.state.players[1].hole_cards = [
-                Card(Rank.FOUR, Suit.SPADES),
-                Card(Rank.FIVE, Suit.CLUBS),
-            ]
-
-            winner_data = []
-
-            async def mock_broadcast(game_id, event_type, factory):
-                if event_type == "winner":
-                    winner_data.append(factory("p0"))
-
-            game.set_broadcast(mock_broadcast)
-            await game._run_showdown()
-            assert len(winner_data) == 1
-            payload = winner_data[0]
-            assert "winners" in payload
-            assert "all_hands" in payload
-            assert len(payload["all_hands"]) == 2
-        asyncio.run(_run())
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_showdown_awards_best_hand(self, broadcast):
+        game = _make_game(num_players=2)
+        game.state.pot = 200
+        game.state.community_cards = [
+            Card(Rank.TEN, Suit.HEARTS),
+            Card(Rank.JACK, Suit.HEARTS),
+            Card(Rank.QUEEN, Suit.HEARTS),
+            Card(Rank.TWO, Suit.CLUBS),
+            Card(Rank.THREE, Suit.DIAMONDS),
+        ]
+        # p0 gets a pair of aces
+        game.state.players[0].hole_cards = [
+            Card(Rank.ACE, Suit.SPADES),
+            Card(Rank.ACE, Suit.CLUBS),
+        ]
+        # p1 gets a weak hand
+        game.state.players[1].hole_cards = [
+            Card(Rank.FOUR, Suit.SPADES),
+            Card(Rank.FIVE, Suit.CLUBS),
+        ]
+
+        game.set_broadcast(broadcast)
+        await game._run_showdown()
+        # p0 had better hand, should win the whole pot
+        p0, p1 = game.state.players
+        assert (p0.chips, p1.chips, game.state.pot) == (1200, 1000, 0)
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_showdown_split_pot_on_tie(self, broadcast):
+        game = _make_game(num_players=2)
+        game.state.pot = 200
+        game.state.community_cards = [
+            Card(Rank.ACE, Suit.HEARTS),
+            Card(Rank.KING, Suit.HEARTS),
+            Card(Rank.QUEEN, Suit.HEARTS),
+            Card(Rank.JACK, Suit.HEARTS),
+            Card(Rank.TEN, Suit.HEARTS),
+        ]
+        # Both players have the same hand (community cards dominate)
+        game.state.players[0].hole_cards = [
+            Card(Rank.TWO, Suit.SPADES),
+            Card(Rank.THREE, Suit.CLUBS),
+        ]
+        game.state.players[1].hole_cards = [
+            Card(Rank.FOUR, Suit.SPADES),
+            Card(Rank.FIVE, Suit.CLUBS),
+        ]
+
+        game.set_broadcast(broadcast)
+        await game._run_showdown()
+        # Both should have gotten 100 each (split)
+        p0, p1 = game.state.players
+        assert (p0.chips, p1.chips, game.state.pot) == (1100, 1100, 0)
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_showdown_winner_info(self, broadcast):
+        game = _make_game(num_players=2)
+        game.state.pot = 200
+        game.state.community_cards = [
+            Card(Rank.TEN, Suit.HEARTS),
+            Card(Rank.JACK, Suit.HEARTS),
+            Card(Rank.QUEEN, Suit.HEARTS),
+            Card(Rank.TWO, Suit.CLUBS),
+            Card(Rank.THREE, Suit.DIAMONDS),
+        ]
+        game.state.players[0].hole_cards = [
+            Card(Rank.ACE, Suit.SPADES),
+            Card(Rank.ACE, Suit.CLUBS),
+        ]
+        game.state.players[1].hole_cards = [
+            Card(Rank.FOUR, Suit.SPADES),
+            Card(Rank.FIVE, Suit.CLUBS),
+        ]
+
+        game.set_broadcast(broadcast)
+        await game._run_showdown()
+        winner_data = [data for event_type, data in broadcast.calls if event_type == "winner"]
+        assert len(winner_data) == 1
+        payload = winner_data[0]
+        assert "winners" in payload
+        assert "all_hands" in payload
+        assert len(payload["all_hands"]) == 2
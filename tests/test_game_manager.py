@@ -1,53 +1,50 @@
 """Unit tests for game_manager.py — GameManager CRUD."""
+import pytest
+
 from app.game.game_state import GameVariant
 from app.managers.game_manager import GameManager
 
 
-class TestGameManager:
-    def test_create_game(self):
-        gm = GameManager()
-        game = gm.create_game(
-            variant=GameVariant.NO_LIMIT,
-            small_blind=10,
-            big_blind=20,
-        )
-        assert game.state.variant == GameVariant.NO_LIMIT
-        assert game.state.small_blind == 10
-        assert game.state.big_blind == 20
-        assert game.state.max_players == 9
+@pytest.fixture
+def gm():
+    """A fresh, empty GameManager for each test."""
+    return GameManager()
 
-    def test_create_game_custom_params(self):
-        gm = GameManager()
-        game = gm.create_game(
-            variant=GameVariant.FIXED_LIMIT,
-            small_blind=5,
-            big_blind=10,
-            max_players=4,
-            min_buy_in=100,
-            max_buy_in=500,
-        )
-        assert game.state.variant == GameVariant.FIXED_LIMIT
-        assert game.state.max_players == 4
-        assert game.state.min_buy_in == 100
-        assert game.state.max_buy_in == 500
 
-    def test_get_game(self):
-        gm = GameManager()
+class TestGameManager:
+    @pytest.mark.parametrize("kwargs, expected", [
+        pytest.param(
+            {"variant": GameVariant.NO_LIMIT, "small_blind": 10, "big_blind": 20},
+            {"variant": GameVariant.NO_LIMIT, "small_blind": 10, "big_blind": 20,
+             "max_players": 9},
+            id="defaults",
+        ),
+        pytest.param(
+            {"variant": GameVariant.FIXED_LIMIT, "small_blind": 5, "big_blind": 10,
+             "max_players": 4, "min_buy_in": 100, "max_buy_in": 500},
+            {"variant": GameVariant.FIXED_LIMIT, "max_players": 4,
+             "min_buy_in": 100, "max_buy_in": 500},
+            id="custom_params",
+        ),
+    ])
+    def test_create_game(self, gm, kwargs, expected):
+        game = gm.create_game(**kwargs)
+        for attr, value in expected.items():
+            assert getattr(game.state, attr) == value
+
+    def test_get_game(self, gm):
         game = gm.create_game(GameVariant.NO_LIMIT, 10, 20)
         game_id = game.state.game_id
         retrieved = gm.get_game(game_id)
         assert retrieved is game
 
-    def test_get_game_not_found(self):
-        gm = GameManager()
+    def test_get_game_not_found(self, gm):
         assert gm.get_game("nonexistent") is None
 
-    def test_list_games_empty(self):
-        gm = GameManager()
+    def test_list_games_empty(self, gm):
         assert gm.list_games() == []
 
-    def test_list_games(self):
-        gm = GameManager()
+    def test_list_games(self, gm):
         g1 = gm.create_game(GameVariant.NO_LIMIT, 10, 20)
         g2 = gm.create_game(GameVariant.FIXED_LIMIT, 5, 10)
         games = gm.list_games()
@@ -64,13 +61,11 @@ class TestGameManager:
             assert "big_blind" in g
             assert "hand_number" in g
 
-    def test_delete_game(self):
-        gm = GameManager()
+    def test_delete_game(self, gm):
         game = gm.create_game(GameVariant.NO_LIMIT, 10, 20)
         game_id = game.state.game_id
         assert gm.delete_game(game_id) is True
         assert gm.get_game(game_id) is None
 
-    def test_delete_game_not_found(self):
-        gm = GameManager()
+    def test_delete_game_not_found(self, gm):
         assert gm.delete_game("nonexistent") is False
@@ -1,83 +1,53 @@
 """Unit tests for hand_evaluator.py"""
 import pytest
 from app.core.card import Card, Rank, Suit, Deck
-from app.core.hand_evaluator import eval_5, eval_7, rank_to_class, rank_to_string, HandClass
+from app.core.hand_evaluator import eval_5, eval_7, eval_best, eval_best_ints, rank_to_class, rank_to_string, HandClass
+
+
+_RANK_CODES = {
+    '2': Rank.TWO, '3': Rank.THREE, '4': Rank.FOUR, '5': Rank.FIVE,
+    '6': Rank.SIX, '7': Rank.SEVEN, '8': Rank.EIGHT, '9': Rank.NINE,
+    '10': Rank.TEN, 'J': Rank.JACK, 'Q': Rank.QUEEN, 'K': Rank.KING, 'A': Rank.ACE,
+}
+_SUIT_CODES = {'c': Suit.CLUBS, 'd': Suit.DIAMONDS, 'h': Suit.HEARTS, 's': Suit.SPADES}
+# All 52 cards keyed by spec ('Ah', '10c', ...); Card is frozen, so instances are shared.
+_CARDS_BY_SPEC = {
+    r + s: Card(rank, suit)
+    for r, rank in _RANK_CODES.items()
+    for s, suit in _SUIT_CODES.items()
+}
 
 
 def make_cards(*specs: str) -> list[Card]:
     """Parse cards like 'Ah', 'Kd', '10c', '2s'."""
-    rank_map = {
-        '2': Rank.TWO, '3': Rank.THREE, '4': Rank.FOUR, '5': Rank.FIVE,
-        '6': Rank.SIX, '7': Rank.SEVEN, '8': Rank.EIGHT, '9': Rank.NINE,
-        '10': Rank.TEN, 'J': Rank.JACK, 'Q': Rank.QUEEN, 'K': Rank.KING, 'A': Rank.ACE,
-    }
-    suit_map = {'c': Suit.CLUBS, 'd': Suit.DIAMONDS, 'h': Suit.HEARTS, 's': Suit.SPADES}
-    return [Card(rank_map[s[:-1]], suit_map[s[-1]]) for s in specs]
+    return [_CARDS_BY_SPEC[s] for s in specs]
+
+
+# (cards, expected class or None, expected score or None)
+_EVAL5_CASES = [
+    pytest.param("Ah Kh Qh Jh 10h", None, 1, id="royal_flush_score_1"),
+    pytest.param("5h 4h 3h 2h Ah", None, 10, id="worst_straight_flush"),  # wheel
+    pytest.param("Ah Ad As Ac Kh", HandClass.FOUR_OF_A_KIND, 11, id="four_aces_best_quads"),
+    pytest.param("Ah Ad As Kh Kd", HandClass.FULL_HOUSE, 167, id="full_house"),
+    pytest.param("Ah Kh Qh Jh 9h", HandClass.FLUSH, None, id="flush"),
+    pytest.param("Ah Kd Qc Js 10h", HandClass.STRAIGHT, 1600, id="straight_ace_high"),
+    pytest.param("Ah 2d 3c 4s 5h", HandClass.STRAIGHT, 1609, id="straight_wheel"),
+    pytest.param("Ah Ad As Kh Qd", HandClass.THREE_OF_A_KIND, None, id="three_of_a_kind"),
+    pytest.param("Ah Ad Kh Kd Qc", HandClass.TWO_PAIR, None, id="two_pair"),
+    pytest.param("Ah Ad Kh Qd Jc", HandClass.ONE_PAIR, None, id="one_pair"),
+    pytest.param("Ah Kd Qc Js 9h", HandClass.HIGH_CARD, None, id="high_card"),
+    pytest.param("7h 5d 4c 3s 2h", None, 7462, id="worst_hand"),
+]
 
 
 class TestEval5:
-    def test_royal_flush_score_1(self):
-        cards = make_cards('Ah', 'Kh', 'Qh', 'Jh', '10h')
-        assert eval_5(cards) == 1
-
-    def test_worst_straight_flush(self):
-        cards = make_cards('5h', '4h', '3h', '2h', 'Ah')
-        score = eval_5(cards)
-        assert score == 10  # Wheel straight flush
-
-    def test_four_aces_best_quads(self):
-        cards = make_cards('Ah', 'Ad', 'As', 'Ac', 'Kh')
-        score = eval_5(cards)
-        assert rank_to_class(score) == HandClass.FOUR_OF_A_KIND
-        assert score == 11
-
-    def test_full_house(self):
-        cards = make_cards('Ah', 'Ad', 'As', 'Kh', 'Kd')
-        score = eval_5(cards)
-        assert rank_to_class(score) == HandClass.FULL_HOUSE
-        assert score == 167
-
-    def test_flush(self):
-        cards = make_cards('Ah', 'Kh', 'Qh', 'Jh', '9h')
-        score = eval_5(cards)
-        assert rank_to_class(score) == HandClass.FLUSH
-
-    def test_straight_ace_high(self):
-        cards = make_cards('Ah', 'Kd', 'Qc', 'Js', '10h')
-        score = eval_5(cards)
-        assert rank_to_class(score) == HandClass.STRAIGHT
-        assert score == 1600
-
-    def test_straight_wheel(self):
-        cards = make_cards('Ah', '2d', '3c', '4s', '5h')
-        score = eval_5(cards)
-        assert rank_to_class(score) == HandClass.STRAIGHT
-        assert score == 1609
-
-    def test_three_of_a_kind(self):
-        cards = make_cards('Ah', 'Ad', 'As', 'Kh', 'Qd')
-        score = eval_5(cards)
-        assert rank_to_class(score) == HandClass.THREE_OF_A_KIND
-
-    def test_two_pair(self):
-        cards = make_cards('Ah', 'Ad', 'Kh', 'Kd', 'Qc')
-        score = eval_5(cards)
-        assert rank_to_class(score) == HandClass.TWO_PAIR
-
-    def test_one_pair(self):
-        cards = make_cards('Ah', 'Ad', 'Kh', 'Qd', 'Jc')
-        score = eval_5(cards)
-        assert rank_to_class(score) == HandClass.ONE_PAIR
-
-    def test_high_card(self):
-        cards = make_cards('Ah', 'Kd', 'Qc', 'Js', '9h')
-        score = eval_5(cards)
-        assert rank_to_class(score) == HandClass.HIGH_CARD
-
-    def test_worst_hand(self):
-        cards = make_cards('7h', '5d', '4c', '3s', '2h')
-        score = eval_5(cards)
-        assert score == 7462
+    @pytest.mark.parametrize("spec, hand_class, score", _EVAL5_CASES)
+    def test_eval5(self, spec, hand_class, score):
+        result = eval_5(make_cards(*spec.split()))
+        if hand_class is not None:
+            assert rank_to_class(result) == hand_class
+        if score is not None:
+            assert result == score
 
     def test_better_flush_beats_worse(self):
         nut_flush = make_cards('Ah', 'Kh', 'Qh', 'Jh', '9h')
@@ -124,32 +94,41 @@ class TestRankToString:
 class TestEvalBest:
     def test_eval_best_5_cards(self):
         cards = make_cards('Ah', 'Kh', 'Qh', 'Jh', '10h')
-        from app.core.hand_evaluator import eval_best
         assert eval_best(cards) == 1
 
     def test_eval_best_6_cards(self):
-        from app.core.hand_evaluator import eval_best
         cards = make_cards('Ah', 'Kh', 'Qh', 'Jh', '10h', '2c')
         score = eval_best(cards)
         assert score == 1  # Royal flush from best 5
 
     def test_eval_best_7_cards(self):
-        from app.core.hand_evaluator import eval_best
         cards = make_cards('Ah', 'Kh', 'Qh', 'Jh', '10h', '2c', '3d')
         score = eval_best(cards)
         assert score == 1
 
     def test_eval_best_invalid_count(self):
-        from app.core.hand_evaluator import eval_best
         cards = make_cards('Ah', 'Kh', 'Qh', 'Jh')
         with pytest.raises(ValueError):
             eval_best(cards)
 
+    @pytest.mark.parametrize("spec", [
+        pytest.param("2c 3h 4s 5d Ah Kh Qh", id="no_flush"),
+        pytest.param("Ah Kh Qh 2h 3h As Ad", id="flush"),
+    ])
+    def test_eval_best_ints_matches_eval_best(self, spec):
+        cards = make_cards(*spec.split())
+        for n in (5, 6, 7):
+            assert eval_best_ints([c.to_int() for c in cards[:n]]) == eval_best(cards[:n])
+
+
+@pytest.fixture
+def deck():
+    """A freshly shuffled Deck for each test."""
+    return Deck()
+
 
 class TestCardEncoding:
-    def test_all_52_cards_unique(self):
-        deck = Deck()
-        deck.reset()
+    def test_all_52_cards_unique(self, deck):
         ints = [c.to_int() for c in deck._cards]
         assert len(set(ints)) == 52
 
@@ -178,26 +157,22 @@ class TestCardEncoding:
         assert Rank.TWO < Rank.ACE
         assert not (Rank.ACE < Rank.KING)
 
-    def test_deck_shuffle(self):
-        deck = Deck()
+    def test_deck_shuffle(self, deck):
         cards_before = list(deck._cards)
         deck.shuffle()
         # Shuffled — same cards, possibly different order
         assert len(deck._cards) == 52
 
-    def test_deck_deal(self):
-        deck = Deck()
+    def test_deck_deal(self, deck):
         cards = deck.deal(5)
         assert len(cards) == 5
         assert len(deck) == 47
 
-    def test_deck_deal_one(self):
-        deck = Deck()
+    def test_deck_deal_one(self, deck):
         card = deck.deal_one()
         assert isinstance(card, Card)
         assert len(deck) == 51
 
-    def test_deck_deal_too_many(self):
-        deck = Deck()
+    def test_deck_deal_too_many(self, deck):
         with pytest.raises(ValueError):
             deck.deal(53)
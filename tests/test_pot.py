@@ -38,7 +38,7 @@ class TestSidePots:
         pots = pm.calculate_side_pots(["p1", "p2", "p3"])
         assert len(pots) == 1
         assert pots[0].amount == 300
-        assert set(pots[0].eligible_player_ids) == {"p1", "p2", "p3"}
+        assert pots[0].eligible_player_ids == {"p1", "p2", "p3"}
 
     def test_one_player_all_in(self):
         """
@@ -53,9 +53,9 @@ class TestSidePots:
         pots = pm.calculate_side_pots(["p1", "p2", "p3"])
         assert len(pots) == 2
         assert pots[0].amount == 150
-        assert set(pots[0].eligible_player_ids) == {"p1", "p2", "p3"}
+        assert pots[0].eligible_player_ids == {"p1", "p2", "p3"}
         assert pots[1].amount == 100
-        assert set(pots[1].eligible_player_ids) == {"p2", "p3"}
+        assert pots[1].eligible_player_ids == {"p2", "p3"}
 
     def test_two_players_all_in(self):
         """
@@ -77,11 +77,11 @@ class TestSidePots:
         pots = pm.calculate_side_pots(["p1", "p2", "p3"])
         assert len(pots) == 3
         assert pots[0].amount == 90
-        assert set(pots[0].eligible_player_ids) == {"p1", "p2", "p3"}
+        assert pots[0].eligible_player_ids == {"p1", "p2", "p3"}
         assert pots[1].amount == 100
-        assert set(pots[1].eligible_player_ids) == {"p2", "p3"}
+        assert pots[1].eligible_player_ids == {"p2", "p3"}
         assert pots[2].amount == 20
-        assert set(pots[2].eligible_player_ids) == {"p3"}
+        assert pots[2].eligible_player_ids == {"p3"}
 
     def test_folded_player_not_eligible(self):
         """
@@ -97,7 +97,7 @@ class TestSidePots:
         # No all-ins, so single main pot
         assert len(pots) == 1
         assert pots[0].amount == 250
-        assert set(pots[0].eligible_player_ids) == {"p2", "p3"}
+        assert pots[0].eligible_player_ids == {"p2", "p3"}
 
     def test_total_chips_preserved(self):
         """Total chips in all side pots must equal total contributions."""
@@ -115,7 +115,7 @@ class TestSidePots:
         pm.add_contribution("p2", 100)
         pots = pm.calculate_side_pots(None)
         assert len(pots) == 1
-        assert set(pots[0].eligible_player_ids) == {"p1", "p2"}
+        assert pots[0].eligible_player_ids == {"p1", "p2"}
 
     def test_zero_contributions_returns_empty(self):
         """When all contributions are zero, return empty."""
@@ -148,7 +148,7 @@ class TestPotManagerExtras:
         assert pm.get_contribution("p1") == 50
 
     def test_side_pot_repr(self):
-        sp = SidePot(amount=100, eligible_player_ids=["p1", "p2"])
+        sp = SidePot(amount=100, eligible_player_ids=frozenset({"p1", "p2"}))
         r = repr(sp)
         assert "100" in r
         assert "p1" in r
@@ -1,6 +1,5 @@
 """Unit tests for routes.py — REST API endpoints."""
 import pytest
-from unittest.mock import patch, MagicMock
 from fastapi.testclient import TestClient
 from app.main import app
 
@@ -47,13 +46,15 @@ class TestCreateGame:
         assert resp.status_code == 400
 
 
-class TestJoinGame:
-    def _create_game(self) -> str:
-        resp = client.post("/api/games", json={"max_players": 4})
-        return resp.json()["game_id"]
+@pytest.fixture(scope="class")
+def game_id() -> str:
+    """One 4-seat game shared by a test class; the rejected joins leave it untouched."""
+    resp = client.post("/api/games", json={"max_players": 4})
+    return resp.json()["game_id"]
+
 
-    def test_join_game(self):
-        game_id = self._create_game()
+class TestJoinGame:
+    def test_join_game(self, game_id):
         resp = client.post(f"/api/games/{game_id}/join", json={
             "player_name": "Alice",
             "buy_in": 1000,
@@ -71,16 +72,14 @@ class TestJoinGame:
         })
         assert resp.status_code == 404
 
-    def test_join_game_buy_in_too_low(self):
-        game_id = self._create_game()
+    def test_join_game_buy_in_too_low(self, game_id):
         resp = client.post(f"/api/games/{game_id}/join", json={
             "player_name": "Alice",
             "buy_in": 1,  # below min_buy_in (20*20=400)
         })
         assert resp.status_code == 400
 
-    def test_join_game_buy_in_too_high(self):
-        game_id = self._create_game()
+    def test_join_game_buy_in_too_high(self, game_id):
         resp = client.post(f"/api/games/{game_id}/join", json={
             "player_name": "Alice",
             "buy_in": 999999,  # above max_buy_in (20*200=4000)
@@ -88,6 +87,13 @@ class TestJoinGame:
         assert resp.status_code == 400
 
 
+class TestHealthz:
+    def test_healthz(self):
+        resp = client.get("/healthz")
+        assert resp.status_code == 200
+        assert resp.json() == {"status": "ok"}
+
+
 class TestListGames:
     def test_list_games(self):
         resp = client.get("/api/games")
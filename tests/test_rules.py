@@ -18,11 +18,11 @@ def _make_state(num_players=3, chips=1000, dealer_index=0) -> GameState:
         small_blind=10,
         big_blind=20,
         max_players=9,
+        players=[
+            PlayerState(player_id=f"p{i}", name=f"Player {i}", chips=chips, seat=i)
+            for i in range(num_players)
+        ],
     )
-    for i in range(num_players):
-        state.players.append(PlayerState(
-            player_id=f"p{i}", name=f"Player {i}", chips=chips, seat=i,
-        ))
     state.dealer_index = dealer_index
     return state
 
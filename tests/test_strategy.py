@@ -1,11 +1,38 @@
 """Unit tests for strategy.py — StrategyEngine."""
-import random
 import pytest
 from app.ai.strategy import StrategyEngine
 from app.game.betting import BettingAction, ValidActions
 from app.game.game_state import GameState, GameVariant, PlayerState
 
 
+class _FixedRandom:
+    """Stands in for random.Random; every draw returns `value`."""
+
+    def __init__(self, value: float):
+        self.value = value
+
+    def random(self) -> float:
+        return self.value
+
+
+@pytest.fixture(scope="module")
+def engine():
+    """StrategyEngine holds only the module-level RNG hook, so one instance serves the whole module."""
+    return StrategyEngine()
+
+
+@pytest.fixture(scope="module")
+def lucky_engine():
+    """Every random branch fires (draws 0.0, below any threshold)."""
+    return StrategyEngine(rng=_FixedRandom(0.0))
+
+
+@pytest.fixture(scope="module")
+def unlucky_engine():
+    """No random branch fires (draws 0.99, above every threshold)."""
+    return StrategyEngine(rng=_FixedRandom(0.99))
+
+
 def _make_state(pot=100, num_players=3, dealer_index=0) -> GameState:
     state = GameState(
         game_id="test",
@@ -13,11 +40,11 @@ def _make_state(pot=100, num_players=3, dealer_index=0) -> GameState:
         small_blind=10,
         big_blind=20,
         max_players=9,
+        players=[
+            PlayerState(player_id=f"p{i}", name=f"Player {i}", chips=1000, seat=i)
+            for i in range(num_players)
+        ],
     )
-    for i in range(num_players):
-        state.players.append(PlayerState(
-            player_id=f"p{i}", name=f"Player {i}", chips=1000, seat=i,
-        ))
     state.pot = pot
     state.dealer_index = dealer_index
     return state
@@ -42,186 +69,115 @@ def _make_valid(
 
 
 class TestPotOdds:
-    def test_basic_pot_odds(self):
-        engine = StrategyEngine()
-        state = _make_state(pot=100)
-        valid = _make_valid(call_amount=50)
-        odds = engine._pot_odds(state, valid)
-        # 50 / (100 + 50) = 1/3
-        assert abs(odds - 1 / 3) < 0.001
-
-    def test_zero_call_returns_zero(self):
-        engine = StrategyEngine()
-        state = _make_state(pot=100)
-        valid = _make_valid(call_amount=0)
-        assert engine._pot_odds(state, valid) == 0.0
-
-    def test_large_call_high_odds(self):
-        engine = StrategyEngine()
-        state = _make_state(pot=10)
-        valid = _make_valid(call_amount=100)
-        odds = engine._pot_odds(state, valid)
-        # 100 / (10 + 100) ≈ 0.909
-        assert odds > 0.9
+    @pytest.mark.parametrize("pot, call_amount, expected", [
+        pytest.param(100, 50, 50 / 150, id="basic_pot_odds"),
+        pytest.param(100, 0, 0.0, id="zero_call_returns_zero"),
+        pytest.param(10, 100, 100 / 110, id="large_call_high_odds"),
+    ])
+    def test_pot_odds(self, engine, pot, call_amount, expected):
+        state = _make_state(pot=pot)
+        valid = _make_valid(call_amount=call_amount)
+        assert engine._pot_odds(state, valid) == pytest.approx(expected)
 
 
 class TestPotSizeBet:
-    def test_half_pot(self):
-        engine = StrategyEngine()
-        state = _make_state(pot=100)
-        valid = _make_valid(call_amount=0, min_raise=20, max_raise=1000)
-        result = engine._pot_size_bet(state, 0.5, valid)
-        # target = 0 + 100*0.5 = 50, clamped to [20, 1000]
-        assert result == 50
-
-    def test_respects_min_raise(self):
-        engine = StrategyEngine()
-        state = _make_state(pot=10)
-        valid = _make_valid(call_amount=0, min_raise=40, max_raise=1000)
-        result = engine._pot_size_bet(state, 0.1, valid)
-        # target = 0 + 10*0.1 = 1, clamped to min_raise 40
-        assert result == 40
-
-    def test_respects_max_raise(self):
-        engine = StrategyEngine()
-        state = _make_state(pot=10000)
-        valid = _make_valid(call_amount=0, min_raise=20, max_raise=500)
-        result = engine._pot_size_bet(state, 1.0, valid)
-        assert result == 500
+    # target = call + pot * fraction, clamped to [min_raise, max_raise]
+    @pytest.mark.parametrize("pot, fraction, min_raise, max_raise, expected", [
+        pytest.param(100, 0.5, 20, 1000, 50, id="half_pot"),
+        pytest.param(10, 0.1, 40, 1000, 40, id="respects_min_raise"),
+        pytest.param(10000, 1.0, 20, 500, 500, id="respects_max_raise"),
+    ])
+    def test_pot_size_bet(self, engine, pot, fraction, min_raise, max_raise, expected):
+        state = _make_state(pot=pot)
+        valid = _make_valid(call_amount=0, min_raise=min_raise, max_raise=max_raise)
+        assert engine._pot_size_bet(state, fraction, valid) == expected
 
 
 class TestIsInPosition:
-    def test_dealer_not_in_position_with_3_players(self):
-        engine = StrategyEngine()
-        state = _make_state(num_players=3, dealer_index=0)
-        player = state.players[0]
-        # relative = (0 - 0) % 3 = 0, n//2 = 1 → 0 >= 1 is False
-        assert engine._is_in_position(state, player) is False
-
-    def test_last_seat_in_position(self):
-        engine = StrategyEngine()
-        state = _make_state(num_players=3, dealer_index=0)
-        player = state.players[2]
-        # relative = (2 - 0) % 3 = 2, n//2 = 1 → 2 >= 1 is True
-        assert engine._is_in_position(state, player) is True
-
-    def test_middle_seat_in_position(self):
-        engine = StrategyEngine()
-        state = _make_state(num_players=4, dealer_index=0)
-        player = state.players[2]
-        # relative = (2 - 0) % 4 = 2, n//2 = 2 → 2 >= 2 is True
-        assert engine._is_in_position(state, player) is True
+    # relative = (seat - dealer) % n; in position when relative >= n // 2
+    @pytest.mark.parametrize("num_players, seat, expected", [
+        pytest.param(3, 0, False, id="dealer_not_in_position_with_3_players"),
+        pytest.param(3, 2, True, id="last_seat_in_position"),
+        pytest.param(4, 2, True, id="middle_seat_in_position"),
+    ])
+    def test_is_in_position(self, engine, num_players, seat, expected):
+        state = _make_state(num_players=num_players, dealer_index=0)
+        assert engine._is_in_position(state, state.players[seat]) is expected
 
 
 class TestEasyStrategy:
-    def test_checks_with_weak_hand(self):
-        engine = StrategyEngine()
+    def test_checks_with_weak_hand(self, engine):
         state = _make_state()
         valid = _make_valid(can_check=True, can_raise=False)
         action, amount = engine._easy(state, state.players[0], valid, equity=0.3)
         assert action == BettingAction.CHECK
         assert amount == 0
 
-    def test_raises_with_high_equity_can_check(self):
+    def test_raises_with_high_equity_can_check(self, lucky_engine):
         """Easy bot: equity > 0.7, can_check, can_raise, random < 0.3 → RAISE."""
-        engine = StrategyEngine()
         state = _make_state(pot=200)
         valid = _make_valid(can_check=True, can_raise=True)
-        found_raise = False
-        for seed in range(100):
-            random.seed(seed)
-            action, amount = engine._easy(state, state.players[0], valid, equity=0.8)
-            if action == BettingAction.RAISE:
-                found_raise = True
-                assert amount >= valid.min_raise
-                break
-        assert found_raise
-
-    def test_folds_weak_hand_when_must_call(self):
-        engine = StrategyEngine()
+        action, amount = lucky_engine._easy(state, state.players[0], valid, equity=0.8)
+        assert action == BettingAction.RAISE
+        assert amount >= valid.min_raise
+
+    def test_folds_weak_hand_when_must_call(self, engine):
         state = _make_state()
         valid = _make_valid(can_check=False, call_amount=20)
-        random.seed(42)
         action, _ = engine._easy(state, state.players[0], valid, equity=0.2)
         assert action == BettingAction.FOLD
 
-    def test_calls_decent_hand(self):
-        engine = StrategyEngine()
+    def test_calls_decent_hand(self, engine):
         state = _make_state(pot=100)
         valid = _make_valid(can_check=False, call_amount=20, can_raise=False)
         action, _ = engine._easy(state, state.players[0], valid, equity=0.6)
         assert action == BettingAction.CALL
 
-    def test_raises_high_equity_facing_bet(self):
+    def test_raises_high_equity_facing_bet(self, lucky_engine):
         """Easy bot: equity > 0.7, can_raise, facing bet, random < 0.2 → RAISE."""
-        engine = StrategyEngine()
         state = _make_state(pot=200)
         valid = _make_valid(can_check=False, call_amount=20, can_raise=True)
-        found_raise = False
-        for seed in range(200):
-            random.seed(seed)
-            action, amount = engine._easy(state, state.players[0], valid, equity=0.8)
-            if action == BettingAction.RAISE:
-                found_raise = True
-                break
-        assert found_raise
+        action, amount = lucky_engine._easy(state, state.players[0], valid, equity=0.8)
+        assert action == BettingAction.RAISE
 
 
 class TestMediumStrategy:
-    def test_raises_strong_hand_can_check(self):
-        engine = StrategyEngine()
+    def test_raises_strong_hand_can_check(self, engine):
         state = _make_state()
         valid = _make_valid(can_check=True, can_raise=True)
         action, amount = engine._medium(state, state.players[0], valid, equity=0.8)
         assert action == BettingAction.RAISE
         assert amount > 0
 
-    def test_raises_medium_equity_can_check(self):
+    def test_raises_medium_equity_can_check(self, lucky_engine):
         """Medium bot: 0.5 < equity < 0.65, can_check, can_raise, random < 0.3 → RAISE."""
-        engine = StrategyEngine()
         state = _make_state(pot=200)
         valid = _make_valid(can_check=True, can_raise=True)
-        found_raise = False
-        for seed in range(200):
-            random.seed(seed)
-            action, amount = engine._medium(state, state.players[0], valid, equity=0.55)
-            if action == BettingAction.RAISE:
-                found_raise = True
-                break
-        assert found_raise
-
-    def test_folds_below_pot_odds(self):
-        engine = StrategyEngine()
+        action, amount = lucky_engine._medium(state, state.players[0], valid, equity=0.55)
+        assert action == BettingAction.RAISE
+
+    def test_folds_below_pot_odds(self, engine):
         state = _make_state(pot=10)
         valid = _make_valid(can_check=False, call_amount=100, can_raise=False)
         # pot_odds = 100 / (10 + 100) ≈ 0.909, equity 0.5 < 0.909
         action, _ = engine._medium(state, state.players[0], valid, equity=0.5)
         assert action == BettingAction.FOLD
 
-    def test_raises_strong_facing_bet(self):
+    def test_raises_strong_facing_bet(self, engine):
         """Medium bot: equity > 0.7, can_raise, facing bet → RAISE."""
-        engine = StrategyEngine()
         state = _make_state(pot=200)
         valid = _make_valid(can_check=False, call_amount=20, can_raise=True)
         action, amount = engine._medium(state, state.players[0], valid, equity=0.75)
         assert action == BettingAction.RAISE
 
-    def test_raises_medium_facing_bet(self):
+    def test_raises_medium_facing_bet(self, lucky_engine):
         """Medium bot: 0.55 < equity < 0.7, can_raise, random < 0.4 → RAISE."""
-        engine = StrategyEngine()
         state = _make_state(pot=200)
         valid = _make_valid(can_check=False, call_amount=20, can_raise=True)
-        found_raise = False
-        for seed in range(200):
-            random.seed(seed)
-            action, _ = engine._medium(state, state.players[0], valid, equity=0.6)
-            if action == BettingAction.RAISE:
-                found_raise = True
-                break
-        assert found_raise
-
-    def test_calls_above_pot_odds(self):
-        engine = StrategyEngine()
+        action, _ = lucky_engine._medium(state, state.players[0], valid, equity=0.6)
+        assert action == BettingAction.RAISE
+
+    def test_calls_above_pot_odds(self, engine):
         state = _make_state(pot=100)
         valid = _make_valid(can_check=False, call_amount=10, can_raise=False)
         # pot_odds = 10/(100+10) ≈ 0.09, equity 0.5 > 0.09
@@ -230,93 +186,88 @@ class TestMediumStrategy:
 
 
 class TestHardStrategy:
-    def test_raises_strong_hand(self):
-        engine = StrategyEngine()
+    def test_raises_strong_hand(self, unlucky_engine):
         state = _make_state()
         valid = _make_valid(can_check=True, can_raise=True)
-        random.seed(99)  # avoid bluff trigger
-        action, _ = engine._hard(state, state.players[0], valid, equity=0.8)
+        action, _ = unlucky_engine._hard(state, state.players[0], valid, equity=0.8)
         assert action == BettingAction.RAISE
 
-    def test_bluff_raises_can_check(self):
+    def test_bluff_raises_can_check(self, lucky_engine):
         """Hard bot: in position, random < 0.15, can_check, can_raise → bluff RAISE."""
-        engine = StrategyEngine()
         state = _make_state(num_players=3, dealer_index=0)
         player = state.players[2]  # in position
         valid = _make_valid(can_check=True, can_raise=True)
-        found_bluff = False
-        for seed in range(200):
-            random.seed(seed)
-            action, _ = engine._hard(state, player, valid, equity=0.3)
-            if action == BettingAction.RAISE:
-                found_bluff = True
-                break
-        assert found_bluff
-
-    def test_bluff_raises_facing_bet(self):
+        action, _ = lucky_engine._hard(state, player, valid, equity=0.3)
+        assert action == BettingAction.RAISE
+
+    def test_bluff_raises_facing_bet(self, lucky_engine):
         """Hard bot: in position, random < 0.15, facing bet, can_raise → bluff RAISE."""
-        engine = StrategyEngine()
         state = _make_state(num_players=3, dealer_index=0)
         player = state.players[2]  # in position
         valid = _make_valid(can_check=False, call_amount=20, can_raise=True)
-        found_bluff = False
-        for seed in range(200):
-            random.seed(seed)
-            action, _ = engine._hard(state, player, valid, equity=0.3)
-            if action == BettingAction.RAISE:
-                found_bluff = True
-                break
-        assert found_bluff
-
-    def test_folds_weak_hand_no_bluff(self):
-        engine = StrategyEngine()
+        action, _ = lucky_engine._hard(state, player, valid, equity=0.3)
+        assert action == BettingAction.RAISE
+
+    def test_folds_weak_hand_no_bluff(self, unlucky_engine):
         state = _make_state(pot=10)
         valid = _make_valid(can_check=False, call_amount=100, can_raise=True)
-        random.seed(99)  # no bluff (0.15 threshold)
-        action, _ = engine._hard(state, state.players[0], valid, equity=0.01)
+        action, _ = unlucky_engine._hard(state, state.players[0], valid, equity=0.01)
         assert action == BettingAction.FOLD
 
-    def test_value_raise_facing_bet(self):
+    def test_value_raise_facing_bet(self, unlucky_engine):
         """Hard bot: equity > 0.75, can_raise, facing bet → value RAISE."""
-        engine = StrategyEngine()
         state = _make_state(pot=200)
         valid = _make_valid(can_check=False, call_amount=20, can_raise=True)
-        random.seed(999)  # avoid bluff
-        action, _ = engine._hard(state, state.players[0], valid, equity=0.8)
+        action, _ = unlucky_engine._hard(state, state.players[0], valid, equity=0.8)
         assert action == BettingAction.RAISE
 
     def test_raise_medium_equity_in_position(self):
         """Hard bot: 0.55 < equity, in_position, 50% chance → RAISE."""
-        engine = StrategyEngine()
+        # 0.3 is above the 0.15 bluff threshold but below the 0.5 raise one
+        engine = StrategyEngine(rng=_FixedRandom(0.3))
         state = _make_state(num_players=3, dealer_index=0)
         player = state.players[2]  # in position
         valid = _make_valid(can_check=False, call_amount=20, can_raise=True)
-        found_raise = False
-        for seed in range(200):
-            random.seed(seed)
-            action, _ = engine._hard(state, player, valid, equity=0.6)
-            if action == BettingAction.RAISE:
-                found_raise = True
-                break
-        assert found_raise
-
-    def test_call_fallback(self):
+        action, _ = engine._hard(state, player, valid, equity=0.6)
+        assert action == BettingAction.RAISE
+
+    def test_call_fallback(self, unlucky_engine):
         """Hard bot: decent equity, not strong enough, no bluff, can_raise=False → CALL."""
-        random.seed(999)
-        engine = StrategyEngine()
         state = _make_state(pot=200)
         valid = _make_valid(can_check=False, call_amount=20, can_raise=False)
-        action, amount = engine._hard(state, state.players[0], valid, equity=0.5)
+        action, amount = unlucky_engine._hard(state, state.players[0], valid, equity=0.5)
         assert action == BettingAction.CALL
         assert amount == 20
 
-    def test_decide_routes_to_difficulty(self):
-        engine = StrategyEngine()
+    @pytest.mark.parametrize("difficulty", ["easy", "medium", "hard"])
+    def test_decide_routes_to_difficulty(self, engine, difficulty):
         state = _make_state()
         valid = _make_valid(can_check=True, can_raise=False)
-        action, _ = engine.decide(state, state.players[0], valid, 0.3, "easy")
-        assert action == BettingAction.CHECK
-        action, _ = engine.decide(state, state.players[0], valid, 0.3, "medium")
-        assert action == BettingAction.CHECK
-        action, _ = engine.decide(state, state.players[0], valid, 0.3, "hard")
+        action, _ = engine.decide(state, state.players[0], valid, 0.3, difficulty)
         assert action == BettingAction.CHECK
+
+
+class TestRandomThresholds:
+    """Each random branch fires just below its threshold and not at it."""
+
+    @pytest.mark.parametrize("method, equity, can_check, seat, draw, expected", [
+        pytest.param("_easy", 0.8, True, 0, 0.29, BettingAction.RAISE, id="easy_check_raise"),
+        pytest.param("_easy", 0.8, True, 0, 0.3, BettingAction.CHECK, id="easy_check_no_raise"),
+        pytest.param("_easy", 0.8, False, 0, 0.19, BettingAction.RAISE, id="easy_bet_raise"),
+        pytest.param("_easy", 0.8, False, 0, 0.2, BettingAction.CALL, id="easy_bet_no_raise"),
+        pytest.param("_medium", 0.55, True, 0, 0.29, BettingAction.RAISE, id="medium_check_raise"),
+        pytest.param("_medium", 0.55, True, 0, 0.3, BettingAction.CHECK, id="medium_check_no_raise"),
+        pytest.param("_medium", 0.6, False, 0, 0.39, BettingAction.RAISE, id="medium_bet_raise"),
+        pytest.param("_medium", 0.6, False, 0, 0.4, BettingAction.CALL, id="medium_bet_no_raise"),
+        # seat 2 of 3 with the button on seat 0 is in position
+        pytest.param("_hard", 0.3, True, 2, 0.14, BettingAction.RAISE, id="hard_bluff"),
+        pytest.param("_hard", 0.3, True, 2, 0.15, BettingAction.CHECK, id="hard_no_bluff"),
+        pytest.param("_hard", 0.6, False, 2, 0.49, BettingAction.RAISE, id="hard_position_raise"),
+        pytest.param("_hard", 0.6, False, 2, 0.5, BettingAction.CALL, id="hard_position_no_raise"),
+    ])
+    def test_threshold(self, method, equity, can_check, seat, draw, expected):
+        engine = StrategyEngine(rng=_FixedRandom(draw))
+        state = _make_state(pot=200, num_players=3, dealer_index=0)
+        valid = _make_valid(can_check=can_check, call_amount=0 if can_check else 20)
+        action, _ = getattr(engine, method)(state, state.players[seat], valid, equity=equity)
+        assert action == expected